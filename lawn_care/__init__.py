@@ -1,37 +1,47 @@
 """KC Lawn Care Notification System."""
 
-from lawn_care.config import load_config, load_schedule, load_state, save_state
-from lawn_care.scraper import (
-    fetch_soil_temp,
-    fetch_soil_temp_history,
-    fetch_air_temp_forecast,
-    project_soil_temps,
-)
-from lawn_care.triggers import get_upcoming_applications, update_soil_temp_history
-from lawn_care.notify import (
-    format_notification,
-    format_ready_notification,
-    format_heads_up_notification,
-)
-from lawn_care.sheets import read_done_checkboxes, update_dashboard
-from lawn_care.email_notify import send_ready_email, send_heads_up_email
+import importlib
 
-__all__ = [
-    "load_config",
-    "load_schedule",
-    "load_state",
-    "save_state",
-    "fetch_soil_temp",
-    "fetch_soil_temp_history",
-    "fetch_air_temp_forecast",
-    "project_soil_temps",
-    "get_upcoming_applications",
-    "update_soil_temp_history",
-    "format_notification",
-    "format_ready_notification",
-    "format_heads_up_notification",
-    "read_done_checkboxes",
-    "update_dashboard",
-    "send_ready_email",
-    "send_heads_up_email",
-]
+# Lazy re-exports (PEP 562): importing lawn_care no longer eagerly pulls in
+# requests / googleapiclient via scraper, sheets, and email_notify. Each name
+# is resolved from its home module on first attribute access.
+_LAZY = {
+    "load_config": "lawn_care.config",
+    "load_schedule": "lawn_care.config",
+    "load_state": "lawn_care.config",
+    "save_state": "lawn_care.config",
+    "append_completion": "lawn_care.config",
+    "fetch_soil_temp": "lawn_care.scraper",
+    "fetch_soil_temp_history": "lawn_care.scraper",
+    "fetch_air_temp_forecast": "lawn_care.scraper",
+    "fetch_all": "lawn_care.scraper",
+    "project_soil_temps": "lawn_care.scraper",
+    "get_upcoming_applications": "lawn_care.triggers",
+    "update_soil_temp_history": "lawn_care.triggers",
+    "partition_apps": "lawn_care.notify",
+    "PartitionedApps": "lawn_care.notify",
+    "format_notification": "lawn_care.notify",
+    "format_ready_notification": "lawn_care.notify",
+    "format_heads_up_notification": "lawn_care.notify",
+    "read_done_checkboxes": "lawn_care.sheets",
+    "update_dashboard": "lawn_care.sheets",
+    "send_ready_email": "lawn_care.email_notify",
+    "send_ready_emails": "lawn_care.email_notify",
+    "send_heads_up_email": "lawn_care.email_notify",
+}
+
+__all__ = list(_LAZY)
+
+
+def __getattr__(name: str):
+    try:
+        module_name = _LAZY[name]
+    except KeyError:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}") from None
+    value = getattr(importlib.import_module(module_name), name)
+    globals()[name] = value  # cache so subsequent lookups skip __getattr__
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(_LAZY))
@@ -0,0 +1,30 @@
+"""JSON helpers backed by orjson when available, with a stdlib fallback."""
+
+from typing import Any
+
+try:
+    import orjson
+
+    JSONDecodeError = orjson.JSONDecodeError
+
+    def loads(data: bytes | str) -> Any:
+        """Parse JSON from bytes or str."""
+        return orjson.loads(data)
+
+    def dumps(data: Any, indent: bool = False, default=None) -> bytes:
+        """Serialize to JSON bytes, optionally indented."""
+        option = orjson.OPT_INDENT_2 if indent else 0
+        return orjson.dumps(data, option=option, default=default)
+
+except ImportError:
+    import json
+
+    JSONDecodeError = json.JSONDecodeError
+
+    def loads(data: bytes | str) -> Any:
+        """Parse JSON from bytes or str."""
+        return json.loads(data)
+
+    def dumps(data: Any, indent: bool = False, default=None) -> bytes:
+        """Serialize to JSON bytes, optionally indented."""
+        return json.dumps(data, indent=2 if indent else None, default=default).encode("utf-8")
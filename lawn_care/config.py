@@ -1,26 +1,50 @@
 """Configuration and state management for lawn care system."""
 
-import json
+import copy
+import os
 from pathlib import Path
 from typing import Any
 
+from lawn_care import _json
+
 # File paths - relative to project root
 PROJECT_ROOT = Path(__file__).parent.parent
 CONFIG_PATH = PROJECT_ROOT / "config.json"
 STATE_PATH = PROJECT_ROOT / "state.json"
+# Append-only completion log; replayed over state.json on load and
+# compacted away by save_state
+WAL_PATH = PROJECT_ROOT / "state.wal"
 SCHEDULE_PATH = PROJECT_ROOT / "kc-lawn-care-plan-2026.json"
 
+# In-process JSON cache keyed by path; entries are (mtime_ns, size, parsed dict).
+# Avoids re-reading and re-parsing config/schedule/state on repeated loads.
+_CACHE: dict[Path, tuple[int, int, dict[str, Any]]] = {}
+
+
+def _invalidate(path: Path) -> None:
+    """Drop the cached parse for a path (called after writes)."""
+    _CACHE.pop(path, None)
+
 
 def load_json(path: Path) -> dict[str, Any]:
-    """Load JSON file and return contents."""
-    with open(path, "r", encoding="utf-8") as f:
-        return json.load(f)
+    """Load JSON file and return contents, serving unchanged files from cache."""
+    st = os.stat(path)
+    cached = _CACHE.get(path)
+    if cached is not None and cached[0] == st.st_mtime_ns and cached[1] == st.st_size:
+        # Deep-copy so callers can mutate their view without poisoning the cache
+        return copy.deepcopy(cached[2])
+    data = _json.loads(path.read_bytes())
+    _CACHE[path] = (st.st_mtime_ns, st.st_size, copy.deepcopy(data))
+    return data
 
 
-def save_json(path: Path, data: dict[str, Any]) -> None:
-    """Save data to JSON file."""
-    with open(path, "w", encoding="utf-8") as f:
-        json.dump(data, f, indent=2, default=str)
+def save_json(path: Path, data: dict[str, Any], indent: bool = True) -> None:
+    """Save data to JSON file atomically (single write + rename)."""
+    payload = _json.dumps(data, indent=indent, default=str)
+    tmp = path.with_suffix(path.suffix + ".tmp")
+    tmp.write_bytes(payload)
+    os.replace(tmp, path)
+    _invalidate(path)
 
 
 def load_config() -> dict[str, Any]:
@@ -29,22 +53,76 @@ def load_config() -> dict[str, Any]:
 
 
 def load_schedule() -> dict[str, Any]:
-    """Load lawn care schedule."""
-    return load_json(SCHEDULE_PATH)
+    """Load lawn care schedule.
+
+    Product rate strings are parsed to a numeric value here, once at load,
+    so the notification formatters never run the rate regex.
+    """
+    # Imported here: notify pulls in html/re and isn't needed by every
+    # config consumer.
+    from lawn_care.notify import _parse_numeric_rate
+
+    schedule = load_json(SCHEDULE_PATH)
+    for app in schedule.get("applications", []):
+        for product in app.get("products", []):
+            if "rate_numeric" not in product:
+                product["rate_numeric"] = _parse_numeric_rate(
+                    product.get("rate_per_1000sqft") or ""
+                )
+    return schedule
 
 
 def load_state() -> dict[str, Any]:
-    """Load application state, creating default if missing."""
+    """Load application state, creating default if missing.
+
+    Soil temp history is kept as parallel dates/temps lists; a state file
+    written before that layout (list of {"date", "temp"} dicts) is
+    converted on load and rewritten in the new form on the next save.
+
+    Completion events logged since the last snapshot (see
+    append_completion) are replayed on top.
+    """
     if not STATE_PATH.exists():
-        return {
+        state: dict[str, Any] = {
             "completed": {},
-            "soil_temp_history": [],
+            "soil_temp_history_dates": [],
+            "soil_temp_history_temps": [],
             "last_soil_temp_f": None,
             "last_check": None,
         }
-    return load_json(STATE_PATH)
+    else:
+        state = load_json(STATE_PATH)
+        old_history = state.pop("soil_temp_history", None)
+        if old_history is not None and "soil_temp_history_temps" not in state:
+            state["soil_temp_history_dates"] = [e["date"] for e in old_history]
+            state["soil_temp_history_temps"] = [float(e["temp"]) for e in old_history]
+
+    if WAL_PATH.exists():
+        completed = state.setdefault("completed", {})
+        for line in WAL_PATH.read_bytes().splitlines():
+            if not line:
+                continue
+            event = _json.loads(line)
+            if event.get("op") == "complete":
+                completed[event["id"]] = event["date"]
+    return state
+
+
+def append_completion(app_id: str, date_str: str) -> None:
+    """Durably record a completion without rewriting the whole state file.
+
+    Appends one small event line to the log; the next save_state folds it
+    into the state.json snapshot. Cost per mark-done stays O(event) no
+    matter how large the accumulated state grows.
+    """
+    event = {"op": "complete", "id": app_id, "date": date_str}
+    with open(WAL_PATH, "ab") as f:
+        f.write(_json.dumps(event) + b"\n")
 
 
 def save_state(state: dict[str, Any]) -> None:
-    """Save application state."""
-    save_json(STATE_PATH, state)
+    """Save application state and compact the completion log."""
+    # state.json is machine-read only, so skip indentation
+    save_json(STATE_PATH, state, indent=False)
+    # The snapshot now covers everything the log recorded
+    WAL_PATH.unlink(missing_ok=True)
@@ -1,42 +1,54 @@
 """Gmail email notifications for lawn care alerts."""
 
 import base64
+import functools
 import logging
-from email.mime.multipart import MIMEMultipart
-from email.mime.text import MIMEText
+import secrets
+from html import escape
 from typing import Any
 
 from lawn_care.google_auth import get_gmail_service
 from lawn_care.notify import (
+    _fmt_projection_chain,
     _format_app_detail,
-    _format_product_line,
     _format_conditions,
+    _product_render_data,
 )
 
 logger = logging.getLogger(__name__)
 
+# Shared outer HTML shell, compiled once at import. Only the banner color,
+# banner title, and body fragments vary between the two email kinds.
+_EMAIL_SHELL = """
+    <div style="font-family:sans-serif;max-width:600px">
+        <div style="background:{header_bg};color:white;padding:12px 16px;border-radius:8px 8px 0 0">
+            <h2 style="margin:0">{header}</h2>
+        </div>
+        <div style="padding:16px;border:1px solid #ddd;border-top:none;border-radius:0 0 8px 8px">
+    {body}
+        </div>
+    </div>
+    """
+
 
 def _html_product_line(product: dict, area_sqft: float | None) -> str:
     """Format a single product as an HTML list item."""
-    name = product["name"]
-    ptype = product.get("type", "")
-    rate_str = product.get("rate_per_1000sqft") or ""
-    rate_oz = product.get("rate_per_1000sqft_oz")
-
-    parts = [f"<strong>{name}</strong> ({ptype})"]
-
-    if rate_oz is not None:
-        if area_sqft:
-            total_oz = rate_oz * (area_sqft / 1000)
-            parts.append(f" &mdash; {rate_oz} oz/1k sqft, <strong>{total_oz:.1f} oz total</strong>")
-        else:
-            parts.append(f" &mdash; {rate_oz} oz/1k sqft")
-    elif rate_str:
-        parts.append(f" &mdash; {rate_str}/1k")
-
-    html = "".join(parts)
-    if product.get("notes"):
-        html += f'<br><span style="color:#666;font-size:0.9em">{product["notes"]}</span>'
+    d = _product_render_data(product, area_sqft)
+    return _html_product_line_cached(d["name"], d["type"], d["html_tail"], d["notes"])
+
+
+@functools.lru_cache(maxsize=256)
+def _html_product_line_cached(name: str, ptype: str, html_tail: str, notes: str) -> str:
+    """
+    Build (and cache) the HTML list item for one product.
+
+    The rate math lives in the shared _product_render_data; this only
+    escapes the remaining fields and wraps them in markup. The same
+    products recur run to run, so the snippet is cached on its inputs.
+    """
+    html = f"<strong>{escape(name)}</strong> ({escape(ptype)}){html_tail}"
+    if notes:
+        html += f'<br><span style="color:#666;font-size:0.9em">{escape(notes)}</span>'
 
     return f"<li>{html}</li>"
 
@@ -46,89 +58,181 @@ def _html_conditions(app: dict) -> str:
     text_lines = _format_conditions(app)
     if not text_lines:
         return ""
-    items = "".join(f"<li>{line.strip()}</li>" for line in text_lines)
+    items = "".join([f"<li>{line.strip()}</li>" for line in text_lines])
     return f'<ul style="margin:4px 0">{items}</ul>'
 
 
 def _html_app_detail(app: dict, area_sqft: float | None) -> str:
     """Format a full application detail block as HTML."""
-    html = f'<h3 style="margin:12px 0 4px">{app["name"]}</h3>'
-    html += f'<p style="margin:2px 0;color:#555">{app.get("reason", "")}</p>'
-
-    if app.get("products"):
-        html += '<p style="margin:8px 0 2px"><strong>Products:</strong></p><ul style="margin:4px 0">'
-        for p in app["products"]:
-            html += _html_product_line(p, area_sqft)
-        html += "</ul>"
+    parts = [
+        f'<h3 style="margin:12px 0 4px">{app["name"]}</h3>',
+        f'<p style="margin:2px 0;color:#555">{app.get("reason", "")}</p>',
+    ]
+
+    products = app.get("products")
+    if products:
+        parts.append('<p style="margin:8px 0 2px"><strong>Products:</strong></p><ul style="margin:4px 0">')
+        for p in products:
+            parts.append(_html_product_line(p, area_sqft))
+        parts.append("</ul>")
 
     cond_html = _html_conditions(app)
     if cond_html:
-        html += f'<p style="margin:8px 0 2px"><strong>Conditions:</strong></p>{cond_html}'
+        parts.append(f'<p style="margin:8px 0 2px"><strong>Conditions:</strong></p>{cond_html}')
 
-    for w in app.get("warnings", []):
-        html += f'<p style="color:#c00;margin:2px 0"><strong>!! {w}</strong></p>'
+    for w in app.get("warnings", ()):
+        parts.append(f'<p style="color:#c00;margin:2px 0"><strong>!! {w}</strong></p>')
 
-    return html
+    return "".join(parts)
 
 
-def _send_email(subject: str, html_body: str, text_body: str) -> bool:
-    """Send an email via Gmail API to the authenticated user (self-send)."""
-    service = get_gmail_service()
+def _build_raw_message(subject: str, html_body: str, text_body: str) -> str:
+    """
+    Build a base64url-encoded RFC822 message for the Gmail API.
 
-    msg = MIMEMultipart("alternative")
-    msg["Subject"] = subject
-    msg["To"] = "me"
-    msg["From"] = "me"
+    The message shape is fixed (multipart/alternative with one text and one
+    html part), so assemble it directly instead of going through the much
+    slower email.mime/BytesGenerator machinery. Non-ASCII subjects take the
+    stdlib path, which handles RFC2047 encoding.
+    """
+    if not subject.isascii():
+        from email.mime.multipart import MIMEMultipart
+        from email.mime.text import MIMEText
+
+        msg = MIMEMultipart("alternative")
+        msg["Subject"] = subject
+        msg["To"] = "me"
+        msg["From"] = "me"
+        msg.attach(MIMEText(text_body, "plain"))
+        msg.attach(MIMEText(html_body, "html"))
+        return base64.urlsafe_b64encode(msg.as_bytes()).decode()
+
+    boundary = secrets.token_hex(16)
+    raw = (
+        f"From: me\r\n"
+        f"To: me\r\n"
+        f"Subject: {subject}\r\n"
+        f"MIME-Version: 1.0\r\n"
+        f'Content-Type: multipart/alternative; boundary="{boundary}"\r\n'
+        f"\r\n"
+        f"--{boundary}\r\n"
+        f"Content-Type: text/plain; charset=utf-8\r\n"
+        f"Content-Transfer-Encoding: 8bit\r\n"
+        f"\r\n"
+        f"{text_body}\r\n"
+        f"--{boundary}\r\n"
+        f"Content-Type: text/html; charset=utf-8\r\n"
+        f"Content-Transfer-Encoding: 8bit\r\n"
+        f"\r\n"
+        f"{html_body}\r\n"
+        f"--{boundary}--\r\n"
+    ).encode("utf-8")
+    return base64.urlsafe_b64encode(raw).decode()
+
+
+def _send_emails(messages: list[tuple[str, str, str]]) -> bool:
+    """
+    Send one or more (subject, html, text) emails via the Gmail API.
 
-    msg.attach(MIMEText(text_body, "plain"))
-    msg.attach(MIMEText(html_body, "html"))
+    Multiple messages are coalesced into a single batch HTTP request so a
+    run that produces both READY and HEADS UP emails pays one round trip.
+    Returns True only if every message was accepted.
+    """
+    if not messages:
+        return True
 
-    raw = base64.urlsafe_b64encode(msg.as_bytes()).decode()
+    service = get_gmail_service()
+    failures = []
 
     try:
-        service.users().messages().send(
-            userId="me",
-            body={"raw": raw},
-        ).execute()
-        logger.info(f"Email sent: {subject}")
-        return True
+        if len(messages) == 1:
+            subject, html_body, text_body = messages[0]
+            service.users().messages().send(
+                userId="me",
+                body={"raw": _build_raw_message(subject, html_body, text_body)},
+            ).execute()
+            logger.info(f"Email sent: {subject}")
+            return True
+
+        def _on_result(request_id, response, exception):
+            if exception is not None:
+                failures.append((request_id, exception))
+
+        batch = service.new_batch_http_request(callback=_on_result)
+        for subject, html_body, text_body in messages:
+            batch.add(service.users().messages().send(
+                userId="me",
+                body={"raw": _build_raw_message(subject, html_body, text_body)},
+            ))
+        batch.execute()
     except Exception as e:
         logger.error(f"Failed to send email: {e}")
         return False
 
+    if failures:
+        for request_id, exception in failures:
+            logger.error(f"Failed to send email (batch item {request_id}): {exception}")
+        return False
 
-def send_ready_email(
+    logger.info(f"Emails sent: {', '.join([subject for subject, _, _ in messages])}")
+    return True
+
+
+def _send_email(subject: str, html_body: str, text_body: str) -> bool:
+    """Send an email via Gmail API to the authenticated user (self-send)."""
+    return _send_emails([(subject, html_body, text_body)])
+
+
+def _ready_email_message(
     app: dict[str, Any],
     soil_temp: float | None,
     area_sqft: float | None,
-    config: dict[str, Any],
-) -> bool:
-    """Send a READY NOW email for a single application."""
+) -> tuple[str, str, str]:
+    """Build the (subject, html, text) message for one READY NOW app."""
     subject = f"Lawn Care READY: {app['name']}"
 
     # HTML body
-    html = f"""
-    <div style="font-family:sans-serif;max-width:600px">
-        <div style="background:#2d7a2d;color:white;padding:12px 16px;border-radius:8px 8px 0 0">
-            <h2 style="margin:0">Ready Now</h2>
-        </div>
-        <div style="padding:16px;border:1px solid #ddd;border-top:none;border-radius:0 0 8px 8px">
-    """
+    parts = []
     if soil_temp is not None:
-        html += f'<p style="margin:0 0 12px"><strong>Soil temp (4"):</strong> {soil_temp}F</p>'
+        parts.append(f'<p style="margin:0 0 12px"><strong>Soil temp (4"):</strong> {soil_temp}F</p>')
 
-    html += _html_app_detail(app, area_sqft)
-    html += """
-        </div>
-    </div>
-    """
+    parts.append(_html_app_detail(app, area_sqft))
+    html = _EMAIL_SHELL.format_map({
+        "header_bg": "#2d7a2d",
+        "header": "Ready Now",
+        "body": "".join(parts),
+    })
 
     # Plaintext fallback
     text = _format_app_detail(app, area_sqft)
     if soil_temp is not None:
         text = f'Soil temp (4"): {soil_temp}F\n\n' + text
 
-    return _send_email(subject, html, text)
+    return subject, html, text
+
+
+def send_ready_email(
+    app: dict[str, Any],
+    soil_temp: float | None,
+    area_sqft: float | None,
+    config: dict[str, Any],
+) -> bool:
+    """Send a READY NOW email for a single application."""
+    return _send_email(*_ready_email_message(app, soil_temp, area_sqft))
+
+
+def send_ready_emails(
+    apps: list[dict[str, Any]],
+    soil_temp: float | None,
+    area_sqft: float | None,
+    config: dict[str, Any],
+) -> bool:
+    """Send READY NOW emails for several applications in one batch request.
+
+    Each app still gets its own email; the batch collapses N API round
+    trips into one. Returns True only if every message was accepted.
+    """
+    return _send_emails([_ready_email_message(a, soil_temp, area_sqft) for a in apps])
 
 
 def send_heads_up_email(
@@ -139,39 +243,34 @@ def send_heads_up_email(
     config: dict[str, Any],
 ) -> bool:
     """Send a HEADS UP summary email for approaching applications."""
-    names = ", ".join(a["name"] for a in apps[:3])
+    names = ", ".join([a["name"] for a in apps[:3]])
     subject = f"Lawn Care HEADS UP: {names}"
 
     # HTML body
-    html = f"""
-    <div style="font-family:sans-serif;max-width:600px">
-        <div style="background:#b8860b;color:white;padding:12px 16px;border-radius:8px 8px 0 0">
-            <h2 style="margin:0">Heads Up - Prep These Products</h2>
-        </div>
-        <div style="padding:16px;border:1px solid #ddd;border-top:none;border-radius:0 0 8px 8px">
-    """
+    parts = []
 
     if soil_temp is not None:
-        html += f'<p style="margin:0"><strong>Soil temp (4"):</strong> {soil_temp}F</p>'
+        parts.append(f'<p style="margin:0"><strong>Soil temp (4"):</strong> {soil_temp}F</p>')
         if projections:
-            temps = [f"{p['projected_soil_temp']:.0f}" for p in projections[:7]]
-            html += f'<p style="margin:2px 0;color:#555">7-day soil forecast: {" &rarr; ".join(temps)}F</p>'
+            chain = _fmt_projection_chain(projections, sep=" &rarr; ")
+            parts.append(f'<p style="margin:2px 0;color:#555">7-day soil forecast: {chain}</p>')
 
     for app in apps:
-        html += "<hr>" + _html_app_detail(app, area_sqft)
+        parts.append("<hr>")
+        parts.append(_html_app_detail(app, area_sqft))
 
-    html += """
-        </div>
-    </div>
-    """
+    html = _EMAIL_SHELL.format_map({
+        "header_bg": "#b8860b",
+        "header": "Heads Up - Prep These Products",
+        "body": "".join(parts),
+    })
 
     # Plaintext fallback
     text_lines = []
     if soil_temp is not None:
         text_lines.append(f'Soil temp (4"): {soil_temp}F')
         if projections:
-            temps = [f"{p['projected_soil_temp']:.0f}" for p in projections[:7]]
-            text_lines.append(f"  7-day soil forecast: {' > '.join(temps)}F")
+            text_lines.append(f"  7-day soil forecast: {_fmt_projection_chain(projections)}")
     text_lines.append("")
     text_lines.append("=== HEADS UP - Prep these products ===")
     for app in apps:
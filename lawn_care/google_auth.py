@@ -1,12 +1,18 @@
 """OAuth2 authentication for Google Sheets and Gmail APIs."""
 
+import contextlib
+import functools
 import logging
 from pathlib import Path
 
-from google.auth.transport.requests import Request
-from google.oauth2.credentials import Credentials
-from google_auth_oauthlib.flow import InstalledAppFlow
-from googleapiclient.discovery import build
+try:
+    import fcntl
+except ImportError:  # Windows (run_lawn_notify.bat) - no flock available
+    fcntl = None
+
+# The google client libraries are imported inside the functions that use
+# them: googleapiclient's discovery import alone costs hundreds of ms,
+# which the notifier shouldn't pay until it actually talks to an API.
 
 logger = logging.getLogger(__name__)
 
@@ -20,38 +26,81 @@ SCOPES = [
 ]
 
 
-def get_credentials() -> Credentials:
+@contextlib.contextmanager
+def _token_lock():
+    """
+    Serialize the token read-refresh-write section across processes.
+
+    Overlapping cron runs that both refresh the same token invalidate one
+    of the two, forcing an interactive re-auth. No-op where flock is
+    unavailable or the token does not exist yet.
+    """
+    if fcntl is None or not TOKEN_PATH.exists():
+        yield
+        return
+    with open(TOKEN_PATH, "r+", encoding="utf-8") as f:
+        fcntl.flock(f, fcntl.LOCK_EX)
+        try:
+            yield
+        finally:
+            fcntl.flock(f, fcntl.LOCK_UN)
+
+
+@functools.lru_cache(maxsize=1)
+def get_credentials():
     """Load or refresh OAuth2 credentials, triggering browser auth on first run."""
+    from google.auth.transport.requests import Request
+    from google.oauth2.credentials import Credentials
+
     creds = None
 
     if TOKEN_PATH.exists():
         creds = Credentials.from_authorized_user_file(str(TOKEN_PATH), SCOPES)
 
-    if not creds or not creds.valid:
-        if creds and creds.expired and creds.refresh_token:
-            logger.info("Refreshing expired OAuth2 token")
-            creds.refresh(Request())
-        else:
-            if not CREDENTIALS_PATH.exists():
-                raise FileNotFoundError(
-                    f"OAuth2 client config not found at {CREDENTIALS_PATH}. "
-                    "Download it from Google Cloud Console."
-                )
-            logger.info("Starting browser OAuth2 flow")
-            flow = InstalledAppFlow.from_client_secrets_file(str(CREDENTIALS_PATH), SCOPES)
-            creds = flow.run_local_server(port=0)
-
-        TOKEN_PATH.write_text(creds.to_json())
-        logger.info(f"Token saved to {TOKEN_PATH}")
+    if creds and creds.valid:
+        return creds
+
+    with _token_lock():
+        # Another process may have refreshed while we waited on the lock
+        if TOKEN_PATH.exists():
+            creds = Credentials.from_authorized_user_file(str(TOKEN_PATH), SCOPES)
+
+        if not creds or not creds.valid:
+            if creds and creds.expired and creds.refresh_token:
+                logger.info("Refreshing expired OAuth2 token")
+                creds.refresh(Request())
+            else:
+                if not CREDENTIALS_PATH.exists():
+                    raise FileNotFoundError(
+                        f"OAuth2 client config not found at {CREDENTIALS_PATH}. "
+                        "Download it from Google Cloud Console."
+                    )
+                logger.info("Starting browser OAuth2 flow")
+                from google_auth_oauthlib.flow import InstalledAppFlow
+
+                flow = InstalledAppFlow.from_client_secrets_file(str(CREDENTIALS_PATH), SCOPES)
+                creds = flow.run_local_server(port=0)
+
+            token_json = creds.to_json()
+            # Skip the rewrite when the on-disk token is already current
+            if not TOKEN_PATH.exists() or TOKEN_PATH.read_text() != token_json:
+                TOKEN_PATH.write_text(token_json)
+                logger.info(f"Token saved to {TOKEN_PATH}")
 
     return creds
 
 
+@functools.lru_cache(maxsize=1)
 def get_sheets_service():
-    """Build and return a Google Sheets API service object."""
-    return build("sheets", "v4", credentials=get_credentials())
+    """Build and return a Google Sheets API service object (memoized)."""
+    from googleapiclient.discovery import build
 
+    return build("sheets", "v4", credentials=get_credentials(), static_discovery=True)
 
+
+@functools.lru_cache(maxsize=1)
 def get_gmail_service():
-    """Build and return a Gmail API service object."""
-    return build("gmail", "v1", credentials=get_credentials())
+    """Build and return a Gmail API service object (memoized)."""
+    from googleapiclient.discovery import build
+
+    return build("gmail", "v1", credentials=get_credentials(), static_discovery=True)
@@ -2,57 +2,131 @@
 
 import logging
 import re
+from dataclasses import dataclass, field
+from html import escape
 from typing import Any
 
 logger = logging.getLogger(__name__)
 
 
+@dataclass(slots=True)
+class PartitionedApps:
+    """Apps classified once into the three notification buckets."""
+
+    ready: list[dict[str, Any]] = field(default_factory=list)
+    heads_up: list[dict[str, Any]] = field(default_factory=list)
+    upcoming: list[dict[str, Any]] = field(default_factory=list)
+
+
+def partition_apps(apps: list[dict[str, Any]]) -> PartitionedApps:
+    """Classify apps into ready/heads-up/upcoming buckets in one pass."""
+    parts = PartitionedApps()
+    for a in apps:
+        if a["ready"]:
+            parts.ready.append(a)
+        elif a.get("heads_up"):
+            parts.heads_up.append(a)
+        else:
+            parts.upcoming.append(a)
+    return parts
+
+# Leading number (int or float), possibly a range like "2-3" (use first value)
+_RATE_RE = re.compile(r"([\d.]+)")
+
+# Temperature-restriction keys that appear in the schedule JSON, with the
+# label each renders under. Direct lookups instead of substring-scanning
+# every conditions key.
+_TEMP_LIMIT_KEYS = (
+    ("air_temp_min_f", "Min air temp"),
+    ("air_temp_max_f", "Max air temp"),
+    ("air_temp_max_f_for_propiconazole", "Max air temp"),
+)
+
+
 def _parse_numeric_rate(rate_str: str) -> float | None:
     """Extract a leading numeric value from a rate string like '4 lbs' or '2-3 lbs product'."""
     if not rate_str:
         return None
-    # Match leading number (int or float), possibly a range like "2-3" (use first value)
-    m = re.match(r"([\d.]+)", str(rate_str))
+    m = _RATE_RE.match(str(rate_str))
     return float(m.group(1)) if m else None
 
 
-def _format_product_line(product: dict, area_sqft: float | None) -> str:
-    """Format a single product with rate and quantity info."""
+def _product_render_data(product: dict, area_sqft: float | None) -> dict:
+    """
+    Precompute the per-product strings shared by the text and HTML formatters.
+
+    The rate math and numeric-rate parse are done once and cached on the
+    product dict, so a dual-channel run (console + email) formats each
+    product's data a single time.
+    """
+    data = product.get("_render")
+    if data is not None:
+        return data
+
     name = product["name"]
     ptype = product.get("type", "")
-    parts = [f"    {name} ({ptype})"]
-
-    # Determine rate string
     rate_str = product.get("rate_per_1000sqft") or ""
     rate_oz = product.get("rate_per_1000sqft_oz")
 
+    text_tail = ""
+    html_tail = ""
     if rate_oz is not None:
         rate_display = f"{rate_oz} oz/1k sqft"
         if area_sqft:
             total_oz = rate_oz * (area_sqft / 1000)
-            parts.append(f" -- {rate_display}, {total_oz:.1f} oz total")
+            text_tail = f" -- {rate_display}, {total_oz:.1f} oz total"
+            html_tail = f" &mdash; {rate_display}, <strong>{total_oz:.1f} oz total</strong>"
         else:
-            parts.append(f" -- {rate_display}")
+            text_tail = f" -- {rate_display}"
+            html_tail = f" &mdash; {rate_display}"
     elif rate_str:
-        numeric = _parse_numeric_rate(rate_str)
+        # Prefer the value precomputed by load_schedule; fall back to
+        # parsing for product dicts built elsewhere.
+        numeric = product["rate_numeric"] if "rate_numeric" in product else _parse_numeric_rate(rate_str)
         if numeric and area_sqft:
             total = numeric * (area_sqft / 1000)
-            parts.append(f" -- {rate_str}/1k, {total:.1f} total")
+            text_tail = f" -- {rate_str}/1k, {total:.1f} total"
         else:
-            parts.append(f" -- {rate_str}")
+            text_tail = f" -- {rate_str}"
+        html_tail = f" &mdash; {escape(rate_str)}/1k"
 
-    if product.get("notes"):
-        parts.append(f"\n      {product['notes']}")
+    data = {
+        "name": name,
+        "type": ptype,
+        "notes": product.get("notes") or "",
+        "text_tail": text_tail,
+        "html_tail": html_tail,
+    }
+    product["_render"] = data
+    return data
 
-    return "".join(parts)
+
+def _format_product_line(product: dict, area_sqft: float | None) -> str:
+    """Format a single product with rate and quantity info."""
+    d = _product_render_data(product, area_sqft)
+    line = f"    {d['name']} ({d['type']}){d['text_tail']}"
+    if d["notes"]:
+        line += f"\n      {d['notes']}"
+    return line
+
+
+# Shared empty-dict sentinel so the common no-conditions case allocates nothing
+_EMPTY_DICT: dict = {}
+
+
+def _fmt_projection_chain(projections: list[dict], sep: str = " > ") -> str:
+    """Render the 7-day projected soil temp chain, e.g. "52 > 54 > 57F"."""
+    return sep.join([f"{p['projected_soil_temp']:.0f}" for p in projections[:7]]) + "F"
 
 
 def _format_conditions(app: dict) -> list[str]:
     """Extract key conditions and spray notes to surface in the notification."""
-    lines = []
-    conditions = app.get("conditions", {})
-    spray_notes = app.get("spray_notes", {})
+    conditions = app.get("conditions") or _EMPTY_DICT
+    spray_notes = app.get("spray_notes") or _EMPTY_DICT
+    if not conditions and not spray_notes:
+        return []
 
+    lines = []
     if conditions.get("water_in"):
         lines.append("  Water in after application")
     if conditions.get("water_in_asap"):
@@ -75,52 +149,68 @@ def _format_conditions(app: dict) -> list[str]:
         lines.append(f"  Wait {mow_after}d after to mow")
 
     # Temperature restrictions from conditions
-    for key, val in conditions.items():
-        if "air_temp_min_f" in key:
-            lines.append(f"  Min air temp: {val}F")
-        elif "air_temp_max_f" in key:
-            lines.append(f"  Max air temp: {val}F")
+    for key, label in _TEMP_LIMIT_KEYS:
+        val = conditions.get(key)
+        if val is not None:
+            lines.append(f"  {label}: {val}F")
 
     return lines
 
 
 def _format_app_detail(app: dict, area_sqft: float | None) -> str:
-    """Format a full app detail block (used in READY NOW and HEADS UP)."""
-    lines = [app["name"]]
-    lines.append(f"  {app['reason']}")
+    """Format a full app detail block (used in READY NOW and HEADS UP).
 
-    if app.get("products"):
-        lines.append("  Products:")
-        for p in app["products"]:
-            lines.append(_format_product_line(p, area_sqft))
+    The block is memoized on the app dict (like _product_render_data), so
+    console output and the email plaintext fallback share one build. The
+    dicts are re-materialized each run, so staleness isn't a concern.
+    """
+    key = ("_fmt", area_sqft)
+    cached = app.get(key)
+    if cached is not None:
+        return cached
 
-    lines.extend(_format_conditions(app))
+    products = app.get("products")
+    products_block = ""
+    if products:
+        products_block = "\n  Products:\n" + "\n".join(
+            [_format_product_line(p, area_sqft) for p in products]
+        )
 
-    for w in app.get("warnings", []):
-        lines.append(f"  !! {w}")
+    cond_lines = _format_conditions(app)
+    cond_block = "\n" + "\n".join(cond_lines) if cond_lines else ""
 
-    return "\n".join(lines)
+    warnings = app.get("warnings")
+    warn_block = "\n" + "\n".join([f"  !! {w}" for w in warnings]) if warnings else ""
+
+    block = f"{app['name']}\n  {app['reason']}{products_block}{cond_block}{warn_block}"
+    app[key] = block
+    return block
 
 
 def format_notification(
-    apps: list[dict[str, Any]],
+    apps: list[dict[str, Any]] | PartitionedApps,
     soil_temp: float | None,
     projections: list[dict] | None = None,
     area_sqft: float | None = None,
 ) -> str:
-    """Format notification message for upcoming applications."""
+    """Format notification message for upcoming applications.
+
+    Accepts either a raw app list or an already-built PartitionedApps, so
+    callers that partition for their own purposes don't trigger a re-scan.
+    """
     lines = []
 
     if soil_temp is not None:
         lines.append(f"Current soil temp (4\"): {soil_temp}F")
         if projections:
-            temps = [f"{p['projected_soil_temp']:.0f}" for p in projections[:7]]
-            lines.append(f"  7-day soil forecast: {' > '.join(temps)}F")
+            lines.append(f"  7-day soil forecast: {_fmt_projection_chain(projections)}")
         lines.append("")
 
-    ready_apps = [a for a in apps if a["ready"]]
-    heads_up_apps = [a for a in apps if a.get("heads_up")]
-    upcoming_apps = [a for a in apps if not a["ready"] and not a.get("heads_up")]
+    if not isinstance(apps, PartitionedApps):
+        apps = partition_apps(apps)
+    ready_apps = apps.ready
+    heads_up_apps = apps.heads_up
+    upcoming_apps = apps.upcoming
 
     if ready_apps:
         lines.append("=== READY NOW ===")
@@ -136,11 +226,11 @@ def format_notification(
 
     if upcoming_apps:
         lines.append("\n=== COMING UP ===")
-        for app in upcoming_apps[:3]:
-            proj = app["projected_date"]
-            proj_str = proj.strftime("%b %d") if proj else "TBD"
-            lines.append(f"\n{app['name']} (target: {proj_str})")
-            lines.append(f"  {app['reason']}")
+        lines.append("\n".join([
+            f"\n{a['name']} (target: {format(a['projected_date'], '%b %d') if a['projected_date'] else 'TBD'})"
+            f"\n  {a['reason']}"
+            for a in upcoming_apps[:3]
+        ]))
 
     return "\n".join(lines)
 
@@ -170,8 +260,7 @@ def format_heads_up_notification(
     if soil_temp is not None:
         lines.append(f"Soil temp (4\"): {soil_temp}F")
         if projections:
-            temps = [f"{p['projected_soil_temp']:.0f}" for p in projections[:7]]
-            lines.append(f"  7-day soil forecast: {' > '.join(temps)}F")
+            lines.append(f"  7-day soil forecast: {_fmt_projection_chain(projections)}")
     lines.append("")
     lines.append("=== HEADS UP - Prep these products ===")
     for app in apps:
@@ -1,28 +1,132 @@
 """Soil temperature fetching from ClearAg (DTN) and forecast projection via Open-Meteo."""
 
+import hashlib
 import logging
+import os
 import time
+from concurrent.futures import ThreadPoolExecutor
 from datetime import date, timedelta
+from pathlib import Path
 from typing import Any
 
 import requests
 
+from lawn_care import _json
+
 logger = logging.getLogger(__name__)
 
+# On-disk response cache; re-runs within the TTL skip the HTTP round trip
+CACHE_DIR = Path(__file__).parent.parent / ".lawn_cache"
+
 CLEARAG_DAILY_SOIL_URL = "https://ag.us.clearapis.com/v1.1/daily/soil"
 OPEN_METEO_FORECAST_URL = "https://api.open-meteo.com/v1/forecast"
 
+# Shared session so back-to-back API calls in one run reuse the same
+# TCP+TLS connection instead of paying a fresh handshake per request.
+# The adapter retries transient failures (including 429s, honoring the
+# server's Retry-After) so one throttled response doesn't push callers
+# onto the manual-temp fallback path.
+SESSION = requests.Session()
+SESSION.headers.update({"User-Agent": "lawn-plan/1.0"})
+SESSION.mount(
+    "https://",
+    requests.adapters.HTTPAdapter(
+        pool_connections=4,
+        pool_maxsize=8,
+        max_retries=requests.adapters.Retry(
+            total=3,
+            status_forcelist=(429, 500, 502, 503, 504),
+            backoff_factor=0.5,
+            respect_retry_after_header=True,
+            allowed_methods=frozenset(["GET"]),
+        ),
+    ),
+)
+
 # Calibrated from 1 year of ClearAg soil temp vs Open-Meteo air temp
 # for KC area (39.2, -94.6). Soil warms faster than it cools at 0-10cm depth.
 SOIL_ALPHA_RISING = 0.79   # response factor when air temp > soil temp
 SOIL_ALPHA_FALLING = 0.15  # response factor when air temp < soil temp
 
+# fetch_soil_temp and fetch_soil_temp_history request this same window so
+# the second call is served from the on-disk cache instead of a second
+# ClearAg round trip.
+HISTORY_WINDOW_DAYS = 14
+
 
 def _date_to_unix(d: date) -> int:
     """Convert a date to Unix timestamp (midnight UTC)."""
     return int(time.mktime(d.timetuple()))
 
 
+def _cached_get(url: str, params: dict, timeout: int, ttl: int) -> Any | None:
+    """
+    GET JSON from url, serving from the on-disk cache when a response for the
+    same URL+params is younger than ttl seconds. A stale entry is revalidated
+    with If-None-Match / If-Modified-Since when the previous response carried
+    validators; a 304 reuses the cached body and restarts its TTL without
+    re-downloading.
+
+    Returns the parsed JSON, or None when the request is still rate-limited
+    after the adapter's retries. Other HTTP errors raise as before.
+    """
+    key = hashlib.md5(f"{url}?{sorted(params.items())}".encode()).hexdigest()
+    path = CACHE_DIR / f"{key}.json"
+    meta_path = CACHE_DIR / f"{key}.meta"
+
+    cached_body = None
+    try:
+        if path.exists():
+            if time.time() - path.stat().st_mtime < ttl:
+                return _json.loads(path.read_bytes())
+            cached_body = path.read_bytes()
+    except (OSError, ValueError):
+        cached_body = None  # unreadable/corrupt entry - plain fetch
+
+    headers = None
+    if cached_body is not None:
+        try:
+            meta = _json.loads(meta_path.read_bytes())
+            headers = {}
+            if meta.get("etag"):
+                headers["If-None-Match"] = meta["etag"]
+            if meta.get("last_modified"):
+                headers["If-Modified-Since"] = meta["last_modified"]
+        except (OSError, ValueError):
+            headers = None
+
+    response = SESSION.get(url, params=params, timeout=timeout, headers=headers)
+    if response.status_code == 304 and cached_body is not None:
+        # Unchanged upstream: skip the body download and parse the cached
+        # bytes; touching the file restarts the TTL window.
+        try:
+            os.utime(path)
+        except OSError:
+            pass
+        return _json.loads(cached_body)
+    if response.status_code == 429:
+        # Adapter retries exhausted and the endpoint is still throttling.
+        logger.warning(f"Rate limit hit (429) for {url}")
+        return None
+    response.raise_for_status()
+
+    try:
+        CACHE_DIR.mkdir(exist_ok=True)
+        path.write_bytes(response.content)
+        validators = {
+            "etag": response.headers.get("ETag"),
+            "last_modified": response.headers.get("Last-Modified"),
+        }
+        if validators["etag"] or validators["last_modified"]:
+            meta_path.write_bytes(_json.dumps(validators))
+        elif meta_path.exists():
+            meta_path.unlink()
+    except OSError:
+        pass  # caching is best-effort
+
+    return _json.loads(response.content)
+
+
 def fetch_clearag_soil(
     config: dict[str, Any],
     start: date,
@@ -52,12 +156,12 @@ def fetch_clearag_soil(
     }
 
     try:
-        response = requests.get(CLEARAG_DAILY_SOIL_URL, params=params, timeout=15)
-        if response.status_code == 429:
-            logger.warning("ClearAg rate limit hit (429)")
+        # Ranges touching today change as readings land; purely historical
+        # ranges are immutable and can be cached for a day.
+        ttl = 600 if end >= date.today() else 86400
+        data = _cached_get(CLEARAG_DAILY_SOIL_URL, params, timeout=15, ttl=ttl)
+        if data is None:
             return None
-        response.raise_for_status()
-        data = response.json()
 
         # Response is keyed by "lat,lng" -> date -> fields
         location_key = f"{lat},{lng}"
@@ -71,37 +175,39 @@ def fetch_clearag_soil(
         return None
 
 
+def _extract_temp(day_data: dict | None) -> float | None:
+    """Pull the 0-10cm soil temp out of one ClearAg day record, or None."""
+    if not day_data:
+        return None
+    value = day_data.get("soil_temp_0to10cm", {}).get("value")
+    if value is None or value == "n/a":
+        return None
+    return float(value)
+
+
 def fetch_soil_temp(config: dict[str, Any]) -> float | None:
     """
     Fetch current soil temperature (0-10cm avg) in Fahrenheit.
 
-    Tries ClearAg API first, falls back to manual config value.
+    Tries ClearAg API first, falls back to manual config value. Requests
+    the full history window rather than just today, so a following
+    fetch_soil_temp_history call reuses the cached response.
     """
     today = date.today()
-    days = fetch_clearag_soil(config, today, today)
+    days = fetch_clearag_soil(config, today - timedelta(days=HISTORY_WINDOW_DAYS), today)
 
     if days:
-        today_str = today.strftime("%Y-%m-%d")
-        day_data = days.get(today_str)
-        if day_data:
-            field = day_data.get("soil_temp_0to10cm", {})
-            value = field.get("value")
-            if value is not None and value != "n/a":
-                temp = float(value)
-                logger.info(f"ClearAg soil temp: {temp}F (0-10cm avg)")
-                return temp
+        temp = _extract_temp(days.get(today.isoformat()))
+        if temp is not None:
+            logger.info(f"ClearAg soil temp: {temp}F (0-10cm avg)")
+            return temp
 
         # Today might not be available yet; try yesterday
         yesterday = today - timedelta(days=1)
-        yesterday_str = yesterday.strftime("%Y-%m-%d")
-        day_data = days.get(yesterday_str)
-        if day_data:
-            field = day_data.get("soil_temp_0to10cm", {})
-            value = field.get("value")
-            if value is not None and value != "n/a":
-                temp = float(value)
-                logger.info(f"ClearAg soil temp (yesterday): {temp}F (0-10cm avg)")
-                return temp
+        temp = _extract_temp(days.get(yesterday.isoformat()))
+        if temp is not None:
+            logger.info(f"ClearAg soil temp (yesterday): {temp}F (0-10cm avg)")
+            return temp
 
     logger.warning("ClearAg fetch returned no usable data")
 
@@ -117,13 +223,13 @@ def fetch_soil_temp(config: dict[str, Any]) -> float | None:
 
 def fetch_soil_temp_history(
     config: dict[str, Any],
-    days: int = 14,
+    days: int = HISTORY_WINDOW_DAYS,
 ) -> list[dict]:
     """
     Fetch recent soil temp history from ClearAg.
 
     Returns list of {"date": "YYYY-MM-DD", "temp": float} entries,
-    newest first, compatible with the state soil_temp_history format.
+    newest first.
     """
     today = date.today()
     start = today - timedelta(days=days)
@@ -132,23 +238,31 @@ def fetch_soil_temp_history(
     if not data:
         return []
 
-    history = []
-    for date_str in sorted(data.keys(), reverse=True):
-        day_data = data[date_str]
-        field = day_data.get("soil_temp_0to10cm", {})
-        value = field.get("value")
-        if value is not None and value != "n/a":
-            history.append({"date": date_str, "temp": float(value)})
-
-    return history
+    # One pass: extract usable temps, then sort the (date, temp) pairs.
+    # ISO dates sort correctly as strings.
+    usable = [
+        (date_str, temp)
+        for date_str, day_data in data.items()
+        if (temp := _extract_temp(day_data)) is not None
+    ]
+    usable.sort(reverse=True)
+    return [{"date": d, "temp": t} for d, t in usable]
 
 
-def fetch_air_temp_forecast(config: dict[str, Any], days: int = 14) -> list[dict] | None:
+def fetch_air_temp_forecast(
+    config: dict[str, Any],
+    days: int = 14,
+    fields: tuple[str, ...] = ("mean",),
+) -> list[dict] | None:
     """
     Fetch daily air temperature forecast from Open-Meteo.
 
-    Returns list of {"date": "YYYY-MM-DD", "mean": float, "min": float, "max": float}
-    in chronological order (today first), or None on failure.
+    fields selects which of "mean"/"min"/"max" to request; the projection
+    model only needs the mean, so the default keeps the response payload
+    (and its parse) to a third of the full daily set.
+
+    Returns list of {"date": "YYYY-MM-DD", <field>: float, ...} in
+    chronological order (today first), or None on failure.
     Temperatures in Fahrenheit.
     """
     lat = config["location"]["lat"]
@@ -157,31 +271,25 @@ def fetch_air_temp_forecast(config: dict[str, Any], days: int = 14) -> list[dict
     params = {
         "latitude": lat,
         "longitude": lng,
-        "daily": "temperature_2m_max,temperature_2m_min,temperature_2m_mean",
+        "daily": ",".join([f"temperature_2m_{f}" for f in fields]),
         "temperature_unit": "fahrenheit",
         "timezone": "America/Chicago",
         "forecast_days": days,
     }
 
     try:
-        response = requests.get(OPEN_METEO_FORECAST_URL, params=params, timeout=10)
-        response.raise_for_status()
-        data = response.json()
+        data = _cached_get(OPEN_METEO_FORECAST_URL, params, timeout=10, ttl=1800)
+        if data is None:
+            return None
 
         daily = data.get("daily", {})
         dates = daily.get("time", [])
-        maxs = daily.get("temperature_2m_max", [])
-        mins = daily.get("temperature_2m_min", [])
-        means = daily.get("temperature_2m_mean", [])
-
-        forecast = []
-        for i, d in enumerate(dates):
-            forecast.append({
-                "date": d,
-                "mean": means[i],
-                "min": mins[i],
-                "max": maxs[i],
-            })
+        columns = [daily.get(f"temperature_2m_{f}", []) for f in fields]
+
+        forecast = [
+            {"date": d, **dict(zip(fields, values))}
+            for d, *values in zip(dates, *columns)
+        ]
 
         logger.info(f"Open-Meteo forecast: {len(forecast)} days fetched")
         return forecast
@@ -194,6 +302,32 @@ def fetch_air_temp_forecast(config: dict[str, Any], days: int = 14) -> list[dict
         return None
 
 
+def fetch_all(
+    config: dict[str, Any],
+    history_days: int = 0,
+) -> tuple[float | None, list[dict], list[dict] | None]:
+    """
+    Fetch soil temp, soil history (optional), and air forecast concurrently.
+
+    The endpoints are independent network calls, so issuing them from a
+    small thread pool collapses wall time to the slowest single fetch.
+    urllib3's connection pool is thread-safe, so they share SESSION.
+
+    Returns (soil_temp, history, air_forecast); history is [] when
+    history_days is 0.
+    """
+    with ThreadPoolExecutor(max_workers=3) as ex:
+        soil_future = ex.submit(fetch_soil_temp, config)
+        history_future = ex.submit(fetch_soil_temp_history, config, history_days) if history_days else None
+        forecast_future = ex.submit(fetch_air_temp_forecast, config)
+
+        soil_temp = soil_future.result()
+        history = history_future.result() if history_future else []
+        air_forecast = forecast_future.result()
+
+    return soil_temp, history, air_forecast
+
+
 def project_soil_temps(
     current_soil_temp: float,
     air_forecast: list[dict],
@@ -215,14 +349,13 @@ def project_soil_temps(
     starting from tomorrow (skips today since we have actual data).
     """
     projections = []
+    append = projections.append
     soil = current_soil_temp
 
     for day in air_forecast[1:]:  # skip today
-        air_mean = day["mean"]
-        diff = air_mean - soil
-        alpha = alpha_rising if diff > 0 else alpha_falling
-        soil = soil + alpha * diff
-        projections.append({
+        diff = day["mean"] - soil
+        soil += (alpha_rising if diff > 0 else alpha_falling) * diff
+        append({
             "date": day["date"],
             "projected_soil_temp": round(soil, 1),
         })
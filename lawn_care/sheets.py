@@ -1,16 +1,51 @@
 """Google Sheets dashboard for lawn care season tracking."""
 
+import functools
+import hashlib
+import itertools
 import logging
+import random
+import re
+import time
 from datetime import date
 from typing import Any
 
 from lawn_care.google_auth import get_sheets_service
+from lawn_care.notify import _fmt_projection_chain
 
 logger = logging.getLogger(__name__)
 
 
+def _execute_with_retry(request, max_tries: int = 5):
+    """Execute a Sheets API request, retrying transient failures.
+
+    Quota 429s and 5xx blips otherwise abort a refresh partway through a
+    multi-call sequence; exponential backoff with jitter absorbs them.
+    Anything else (or the final attempt) propagates to the caller.
+    """
+    # Deferred so importing this module never pulls in googleapiclient
+    from googleapiclient.errors import HttpError
+
+    for attempt in range(max_tries):
+        try:
+            return request.execute()
+        except HttpError as e:
+            status = e.resp.status
+            if status not in (429, 500, 503) or attempt == max_tries - 1:
+                raise
+            delay = 2 ** attempt + random.random()
+            logger.warning(f"Sheets API returned {status}; retrying in {delay:.1f}s")
+            time.sleep(delay)
+
+
+@functools.lru_cache(maxsize=None)
 def _hex(color: str) -> dict:
-    """Convert '#rrggbb' hex color to Sheets API RGB float dict."""
+    """Convert '#rrggbb' hex color to Sheets API RGB float dict.
+
+    Cached: the palette is a fixed handful of colors re-requested on every
+    structure pass, so each dict is built once per process. Callers treat
+    the returned dict as read-only.
+    """
     h = color.lstrip("#")
     return {
         "red": int(h[0:2], 16) / 255.0,
@@ -26,6 +61,11 @@ HEADERS = [
 ]
 NUM_COLS = len(HEADERS)  # 11 = columns A through K
 
+# Checkbox cell values that count as checked. The API returns "TRUE" for
+# a ticked box (or a bool, depending on render option); one frozenset
+# membership test replaces a str()+upper() per row.
+_TRUE_VALUES = frozenset((True, "TRUE", "True", "true"))
+
 
 def read_done_checkboxes(config: dict[str, Any]) -> list[str]:
     """
@@ -39,21 +79,22 @@ def read_done_checkboxes(config: dict[str, Any]) -> list[str]:
         return []
 
     service = get_sheets_service()
-    # Read from row 3 onward (row 1=headers, row 2=soil temp summary)
-    result = service.spreadsheets().values().get(
+    # Read from row 3 onward (row 1=headers, row 2=soil temp summary).
+    # Only columns A and K matter, so a batchGet of the two keeps the
+    # response to a fraction of the full A:K grid in one round trip.
+    result = _execute_with_retry(service.spreadsheets().values().batchGet(
         spreadsheetId=sheet_id,
-        range="Sheet1!A3:K",
-    ).execute()
-
-    rows = result.get("values", [])
-    done_ids = []
-    for row in rows:
-        if len(row) >= NUM_COLS:
-            checkbox_val = row[0]  # Column A
-            app_id = row[NUM_COLS - 1]  # Column K
-            if checkbox_val is True or str(checkbox_val).upper() == "TRUE":
-                if app_id:
-                    done_ids.append(app_id)
+        ranges=["Sheet1!A3:A", "Sheet1!K3:K"],
+    ))
+
+    ranges = result.get("valueRanges", [{}, {}])
+    a_col = ranges[0].get("values", [])
+    k_col = ranges[1].get("values", [])
+    done_ids = [
+        k[0]
+        for a, k in zip(a_col, k_col)
+        if k and k[0] and a and a[0] in _TRUE_VALUES
+    ]
 
     logger.info(f"Sheet checkboxes: {len(done_ids)} marked done")
     return done_ids
@@ -71,6 +112,9 @@ BRAND_REGISTRY = {
     "Core Aeration":   ("Mechanical", ""),
 }
 _SORTED_PREFIXES = sorted(BRAND_REGISTRY.keys(), key=len, reverse=True)
+# One anchored alternation (longest-first, so greedy matching is preserved)
+# replaces a startswith scan over every prefix per product line.
+_BRAND_RE = re.compile("|".join([re.escape(p) for p in _SORTED_PREFIXES]))
 
 INDENT = "  "
 
@@ -107,21 +151,19 @@ def _format_raw_product_line(product: dict, area_sqft: float | None) -> str:
 
 
 def _group_products_by_brand(raw_lines: list[str]) -> dict[str, list[str]]:
-    """Group raw product strings by brand. Returns OrderedDict of brand -> [product_lines]."""
-    from collections import OrderedDict
-    groups: dict[str, list[str]] = OrderedDict()
+    """Group raw product strings by brand. Returns insertion-ordered dict of brand -> [product_lines]."""
+    groups: dict[str, list[str]] = {}
 
     for line in raw_lines:
         brand_display = "Other"
         product_line = line
 
-        for prefix in _SORTED_PREFIXES:
-            if line.startswith(prefix):
-                display_name, strip_str = BRAND_REGISTRY[prefix]
-                brand_display = display_name
-                if strip_str and line.startswith(strip_str):
-                    product_line = line[len(strip_str):]
-                break
+        m = _BRAND_RE.match(line)
+        if m:
+            display_name, strip_str = BRAND_REGISTRY[m.group(0)]
+            brand_display = display_name
+            if strip_str and line.startswith(strip_str):
+                product_line = line[len(strip_str):]
 
         groups.setdefault(brand_display, []).append(product_line)
 
@@ -140,41 +182,49 @@ def _build_product_cell(products: list[dict], area_sqft: float | None) -> tuple[
     raw_lines = [_format_raw_product_line(p, area_sqft) for p in products]
     groups = _group_products_by_brand(raw_lines)
 
-    cell_parts = []
-    format_runs = []
-    current_index = 0
+    # Collect (text, format) fragments first; run offsets fall out of a
+    # single accumulate pass instead of per-append index bookkeeping.
+    fragments: list[tuple[str, dict | None]] = []
     is_first_group = True
-    brand_keys = list(groups.keys())
+    last_brand = next(reversed(groups))
 
     for brand_name, product_lines in groups.items():
         # Blank line between groups
         if not is_first_group:
-            cell_parts.append("\n")
-            current_index += 1
+            fragments.append(("\n", None))
         is_first_group = False
 
         # Brand header - bold
-        format_runs.append({"startIndex": current_index, "format": _BRAND_FMT})
-        brand_line = brand_name + "\n"
-        cell_parts.append(brand_line)
-        current_index += len(brand_line)
+        fragments.append((brand_name + "\n", _BRAND_FMT))
 
-        # Product lines - normal
+        # Product lines - normal; newline on all but the very last line
+        is_last_group = brand_name is last_brand
+        last_i = len(product_lines) - 1
         for i, product in enumerate(product_lines):
-            format_runs.append({"startIndex": current_index, "format": _PRODUCT_FMT})
-            product_line = INDENT + product
-            # Add newline unless last product of last group
-            is_last = (brand_name == brand_keys[-1] and i == len(product_lines) - 1)
-            if not is_last:
-                product_line += "\n"
-            cell_parts.append(product_line)
-            current_index += len(product_line)
-
-    return "".join(cell_parts), format_runs
+            text = INDENT + product
+            if not (is_last_group and i == last_i):
+                text += "\n"
+            fragments.append((text, _PRODUCT_FMT))
+
+    offsets = itertools.accumulate((len(text) for text, _ in fragments), initial=0)
+    format_runs = [
+        {"startIndex": offset, "format": fmt}
+        for (_, fmt), offset in zip(fragments, offsets)
+        if fmt is not None
+    ]
+    return "".join([text for text, _ in fragments]), format_runs
 
 
 def _format_conditions_text(app: dict) -> str:
-    """Format conditions for Sheet cell."""
+    """Format conditions for Sheet cell.
+
+    Cached on the app dict: conditions come straight from the schedule and
+    never change within a run, so repeated refreshes reuse the first build.
+    """
+    cached = app.get("_conditions_text")
+    if cached is not None:
+        return cached
+
     lines = []
     conditions = app.get("conditions", {})
     spray_notes = app.get("spray_notes", {})
@@ -200,8 +250,59 @@ def _format_conditions_text(app: dict) -> str:
     elif mow_after:
         lines.append(f"Wait {mow_after}d after to mow")
 
+    # Every line is built right here from schedule fields; nothing can
+    # contain a carriage return, so no normalization pass is needed.
     result = "\n".join(lines)
-    return result.replace("\r\n", " ").replace("\r", " ")
+    app["_conditions_text"] = result
+    return result
+
+
+# Month abbreviations for projected-date cells; indexing a tuple skips
+# strftime's locale-aware formatting per row.
+_MONTHS = ("Jan", "Feb", "Mar", "Apr", "May", "Jun",
+           "Jul", "Aug", "Sep", "Oct", "Nov", "Dec")
+
+
+# Checkbox rule for the Done column, attached per-cell so the validation
+# rides along in the same updateCells as the values.
+_CHECKBOX_VALIDATION = {"condition": {"type": "BOOLEAN"}, "showCustomUi": True}
+
+
+def _row_data(row: list, product_runs: list[dict] | None) -> dict:
+    """Convert a row of plain values into Sheets API RowData.
+
+    Column G carries its textFormatRuns inline and the boolean Done cell
+    its checkbox validation, so values, rich text, and validation land in
+    one updateCells instead of a write plus per-concern follow-ups.
+    """
+    values = []
+    for col, value in enumerate(row):
+        if isinstance(value, bool):
+            cell = {
+                "userEnteredValue": {"boolValue": value},
+                "dataValidation": _CHECKBOX_VALIDATION,
+            }
+        else:
+            cell = {"userEnteredValue": {"stringValue": str(value)}}
+        if col == 6 and product_runs:
+            cell["textFormatRuns"] = product_runs
+        values.append(cell)
+    return {"values": values}
+
+
+def _rows_update(sid: int, start: int, end: int, all_rows: list[list], all_runs: list[list[dict]]) -> dict:
+    """Build an updateCells request for a contiguous slice of dashboard rows.
+
+    start/end index into all_rows (soil summary at 0), which sits one row
+    below the header, hence the +1 on the sheet row indices.
+    """
+    return {
+        "updateCells": {
+            "rows": [_row_data(row, runs) for row, runs in zip(all_rows[start:end], all_runs[start:end])],
+            "range": {"sheetId": sid, "startRowIndex": 1 + start, "endRowIndex": 1 + end, "startColumnIndex": 0, "endColumnIndex": NUM_COLS},
+            "fields": "userEnteredValue,textFormatRuns,dataValidation",
+        }
+    }
 
 
 def _build_app_row(app: dict, area_sqft: float | None, completed: dict) -> tuple[list, list[dict]]:
@@ -223,7 +324,7 @@ def _build_app_row(app: dict, area_sqft: float | None, completed: dict) -> tuple
         done_val = False
 
     proj_date = app.get("projected_date")
-    proj_str = proj_date.strftime("%b %d") if proj_date else ""
+    proj_str = f"{_MONTHS[proj_date.month - 1]} {proj_date.day:02d}" if proj_date else ""
 
     completed_date = completed.get(app_id, "")
     product_text, product_runs = _build_product_cell(app.get("products", []), area_sqft)
@@ -269,20 +370,19 @@ def update_dashboard(
     completed = state.get("completed", {})
 
     # Ensure structure first
-    _ensure_sheet_structure(service, sheet_id)
+    sid = _ensure_sheet_structure(service, sheet_id)
 
     # Build soil temp summary row (A2:K2 is merged, so text goes in A2)
     soil_parts = []
     if soil_temp is not None:
         soil_parts.append(f"Soil temp (4\"): {soil_temp}F")
         if projections:
-            temps = [f"{p['projected_soil_temp']:.0f}" for p in projections[:7]]
-            soil_parts.append(f"7-day forecast: {' > '.join(temps)}F")
+            soil_parts.append(f"7-day forecast: {_fmt_projection_chain(projections)}")
     soil_text = " | ".join(soil_parts) if soil_parts else "No soil temp data"
     soil_summary = [soil_text] + [""] * (NUM_COLS - 1)
 
     # Build app rows - use upcoming (sorted) for non-completed, add completed at bottom
-    upcoming_by_id = {a["id"]: a for a in upcoming}
+    upcoming_ids = {a["id"] for a in upcoming}
     all_apps = schedule.get("applications", [])
 
     rows = []
@@ -293,108 +393,180 @@ def update_dashboard(
         rows.append(row)
         product_runs_by_row.append(runs)
 
-    # Then: completed apps (in schedule order)
-    for app in all_apps:
-        if app["id"] in completed and app["id"] not in upcoming_by_id:
-            app_id = app["id"]
-            rows.append([
-                True,                           # A: Done
-                "DONE",                          # B: Status
-                app["name"],                     # C: Application
-                app.get("month_target", ""),      # D: Month
-                "",                              # E: Projected Date
-                f"Completed on {completed[app_id]}",  # F: Reason
-                "",                              # G: Products
-                "",                              # H: Conditions
-                "",                              # I: Warnings
-                completed[app_id],               # J: Completed Date
-                app_id,                          # K: app_id
-            ])
-            product_runs_by_row.append([])
-
-    # Clear old data rows and write new ones
-    service.spreadsheets().values().clear(
-        spreadsheetId=sheet_id,
-        range="Sheet1!A2:K100",
-    ).execute()
-
-    # Write soil summary + app rows
+    # Then: completed apps not in the upcoming list (in schedule order).
+    # Classified once up front; these rows are always DONE.
+    completed_only = [
+        a for a in all_apps
+        if a["id"] in completed and a["id"] not in upcoming_ids
+    ]
+    for app in completed_only:
+        app_id = app["id"]
+        completed_date = completed[app_id]
+        rows.append([
+            True,                            # A: Done
+            "DONE",                          # B: Status
+            app["name"],                     # C: Application
+            app.get("month_target", ""),     # D: Month
+            "",                              # E: Projected Date
+            f"Completed on {completed_date}",  # F: Reason
+            "",                              # G: Products
+            "",                              # H: Conditions
+            "",                              # I: Warnings
+            completed_date,                  # J: Completed Date
+            app_id,                          # K: app_id
+        ])
+        product_runs_by_row.append([])
+
+    # Diff against the rows written by the previous refresh. The snapshot
+    # lives in state (plain bools/strings, so it survives the state.json
+    # round trip); only rows that actually changed are sent, and a fully
+    # unchanged grid skips the write entirely. Most daily runs touch a
+    # couple of rows (soil summary, a status flip), not all ~20.
     all_rows = [soil_summary] + rows
-    service.spreadsheets().values().update(
-        spreadsheetId=sheet_id,
-        range="Sheet1!A2",
-        valueInputOption="USER_ENTERED",
-        body={"values": all_rows},
-    ).execute()
+    all_runs = [[]] + product_runs_by_row
+    previous = state.get("_dashboard_rows")
 
-    # Apply rich text (bold product names) to column G via updateCells
-    _apply_product_rich_text(service, sheet_id, product_runs_by_row, rows)
+    if previous == all_rows:
+        logger.info("Dashboard unchanged; skipping write")
+        return
+
+    # Each contiguous run of changed rows becomes one updateCells request,
+    # all carried in a single batchUpdate: values + rich text + checkbox
+    # validation together, same as the full rewrite used to do.
+    requests_batch = []
+    run_start = None
+    for idx, row in enumerate(all_rows):
+        unchanged = previous is not None and idx < len(previous) and previous[idx] == row
+        if unchanged:
+            if run_start is not None:
+                requests_batch.append(_rows_update(sid, run_start, idx, all_rows, all_runs))
+                run_start = None
+        elif run_start is None:
+            run_start = idx
+    if run_start is not None:
+        requests_batch.append(_rows_update(sid, run_start, len(all_rows), all_rows, all_runs))
+
+    # Blank out rows left over from a previous, longer listing. Clears
+    # values, stale rich text, and stale checkbox validation;
+    # userEnteredFormat is left alone so the structural column
+    # formatting stays intact. Skipped when the listing didn't shrink.
+    if previous is None or len(previous) > len(all_rows):
+        requests_batch.append({
+            "updateCells": {
+                "range": {"sheetId": sid, "startRowIndex": 1 + len(all_rows), "endRowIndex": 100, "startColumnIndex": 0, "endColumnIndex": NUM_COLS},
+                "fields": "userEnteredValue,textFormatRuns,dataValidation",
+            }
+        })
+
+    _execute_with_retry(service.spreadsheets().batchUpdate(
+        spreadsheetId=sheet_id,
+        body={"requests": requests_batch},
+    ))
+
+    # Snapshot only after the write lands, so a failed call re-sends
+    # everything next run instead of silently dropping rows.
+    state["_dashboard_rows"] = all_rows
+
+    changed = sum(r["updateCells"]["range"]["endRowIndex"] - r["updateCells"]["range"]["startRowIndex"]
+                  for r in requests_batch if "rows" in r["updateCells"])
+    logger.info(f"Dashboard updated: {changed} of {len(all_rows)} rows written")
+
+
+# Shared RGB palette for the structure requests; referencing one dict per
+# color avoids rebuilding ~30 identical literals on every setup pass.
+_BORDER_GRAY = {"red": 0.871, "green": 0.886, "blue": 0.898}
+_MUTED_GRAY = {"red": 0.424, "green": 0.459, "blue": 0.490}
+_CF_GREEN_BG = {"red": 0.831, "green": 0.929, "blue": 0.855}
+_CF_GREEN_FG = {"red": 0.082, "green": 0.341, "blue": 0.141}
+_CF_AMBER_BG = {"red": 1.0, "green": 0.953, "blue": 0.804}
+_CF_AMBER_FG = {"red": 0.522, "green": 0.392, "blue": 0.016}
+_CF_DONE_BG = {"red": 0.886, "green": 0.890, "blue": 0.898}
+_WHITE = {"red": 1.0, "green": 1.0, "blue": 1.0}
+
+# Numeric sheetId per spreadsheet, resolved once per process. The id never
+# changes for an existing tab, so repeated refreshes skip the lookup RTT.
+_SHEET_ID_CACHE: dict[str, int] = {}
+
+# Structure-version marker stored in the sheet's developerMetadata. When the
+# stored hash matches, _ensure_sheet_structure skips its entire ~40-request
+# batchUpdate -- the structure only changes when this code does. The hash
+# covers the static inputs; _STRUCTURE_REV is bumped by hand for request
+# changes the inputs don't capture.
+_COL_WIDTHS = [50, 90, 200, 80, 160, 280, 360, 160, 280, 110, 140]
+_STRUCTURE_REV = 1
+_STRUCTURE_METADATA_KEY = "lawn_plan_structure_version"
+_STRUCTURE_VERSION = hashlib.md5(
+    repr((_STRUCTURE_REV, HEADERS, _COL_WIDTHS)).encode()
+).hexdigest()
+
+
+def _get_sheet_numeric_id(service, sheet_id: str) -> int:
+    """Resolve the numeric sheetId of the first tab, caching per spreadsheet."""
+    sid = _SHEET_ID_CACHE.get(sheet_id)
+    if sid is None:
+        spreadsheet = _execute_with_retry(service.spreadsheets().get(
+            spreadsheetId=sheet_id,
+            fields="sheets.properties",
+        ))
+        sid = spreadsheet["sheets"][0]["properties"]["sheetId"]
+        _SHEET_ID_CACHE[sheet_id] = sid
+    return sid
 
-    # Insert checkboxes for the data rows (rows 3 onward)
-    _apply_checkboxes(service, sheet_id, num_app_rows=len(rows))
 
-    logger.info(f"Dashboard updated: {len(rows)} applications written")
+def _ensure_sheet_structure(service, sheet_id: str) -> int:
+    """Idempotent setup: headers, formatting, conditional rules per formatting spec.
 
+    Returns the numeric sheetId so callers don't re-fetch it.
 
-def _ensure_sheet_structure(service, sheet_id: str) -> None:
-    """Idempotent setup: headers, formatting, conditional rules per formatting spec."""
-    # Write headers
-    service.spreadsheets().values().update(
+    On steady state this is a single spreadsheets.get: the sheetId fetch
+    doubles as a read of the stored structure-version metadata, and a
+    matching version skips the whole setup push.
+    """
+    # One get resolves the sheetId, the structure-version marker, and the
+    # existing conditional-format rules / banding that need clearing
+    spreadsheet = _execute_with_retry(service.spreadsheets().get(
+        spreadsheetId=sheet_id,
+        fields="sheets.properties,sheets.developerMetadata,sheets.conditionalFormats,sheets.bandedRanges",
+    ))
+    first_sheet = spreadsheet["sheets"][0]
+    sid = first_sheet["properties"]["sheetId"]
+    _SHEET_ID_CACHE[sheet_id] = sid
+
+    meta_id = None
+    for md in first_sheet.get("developerMetadata", []):
+        if md.get("metadataKey") == _STRUCTURE_METADATA_KEY:
+            if md.get("metadataValue") == _STRUCTURE_VERSION:
+                return sid  # structure already current
+            meta_id = md.get("metadataId")
+            break
+
+    # Write headers. RAW skips server-side formula/date/number parsing,
+    # which we never rely on -- every header is a plain string.
+    _execute_with_retry(service.spreadsheets().values().update(
         spreadsheetId=sheet_id,
         range="Sheet1!A1:K1",
-        valueInputOption="USER_ENTERED",
+        valueInputOption="RAW",
         body={"values": [HEADERS]},
-    ).execute()
-
-    # Get sheetId (usually 0 for Sheet1)
-    spreadsheet = service.spreadsheets().get(
-        spreadsheetId=sheet_id,
-        fields="sheets.properties",
-    ).execute()
-    sid = spreadsheet["sheets"][0]["properties"]["sheetId"]
-
-    # Clear existing conditional format rules to avoid duplicates
-    try:
-        spreadsheet_full = service.spreadsheets().get(
-            spreadsheetId=sheet_id,
-            fields="sheets.conditionalFormats",
-        ).execute()
-        existing_rules = spreadsheet_full["sheets"][0].get("conditionalFormats", [])
-        if existing_rules:
-            delete_requests = [
-                {"deleteConditionalFormatRule": {"sheetId": sid, "index": i}}
-                for i in range(len(existing_rules) - 1, -1, -1)
-            ]
-            service.spreadsheets().batchUpdate(
-                spreadsheetId=sheet_id,
-                body={"requests": delete_requests},
-            ).execute()
-    except Exception:
-        pass
-
-    # Also clear any existing banding
-    try:
-        spreadsheet_bands = service.spreadsheets().get(
-            spreadsheetId=sheet_id,
-            fields="sheets.bandedRanges",
-        ).execute()
-        existing_bands = spreadsheet_bands["sheets"][0].get("bandedRanges", [])
-        if existing_bands:
-            band_deletes = [
-                {"deleteBandedRange": {"bandedRangeId": b["bandedRangeId"]}}
-                for b in existing_bands
-            ]
-            service.spreadsheets().batchUpdate(
-                spreadsheetId=sheet_id,
-                body={"requests": band_deletes},
-            ).execute()
-    except Exception:
-        pass
+    ))
+
+    # Old conditional-format rules and banding are deleted at the front of
+    # the main batch (requests apply in order), replacing what used to be
+    # two extra get probes and two extra batchUpdate calls.
+    cleanup_requests = [
+        {"deleteConditionalFormatRule": {"sheetId": sid, "index": i}}
+        for i in range(len(first_sheet.get("conditionalFormats", [])) - 1, -1, -1)
+    ]
+    cleanup_requests.extend(
+        {"deleteBandedRange": {"bandedRangeId": b["bandedRangeId"]}}
+        for b in first_sheet.get("bandedRanges", [])
+    )
 
     # Data rows range (row 3 onward)
     row3_plus = {"sheetId": sid, "startRowIndex": 2, "endRowIndex": 100, "startColumnIndex": 0, "endColumnIndex": NUM_COLS}
 
     requests_batch = [
+        *cleanup_requests,
+
         # === 1. Column widths ===
         *[
             {
@@ -404,7 +576,7 @@ def _ensure_sheet_structure(service, sheet_id: str) -> None:
                     "fields": "pixelSize",
                 }
             }
-            for i, w in enumerate([50, 90, 200, 80, 160, 280, 360, 160, 280, 110, 140])
+            for i, w in enumerate(_COL_WIDTHS)
         ],
 
         # === 2. Row 2 merge + banner styling ===
@@ -474,8 +646,8 @@ def _ensure_sheet_structure(service, sheet_id: str) -> None:
                     "booleanRule": {
                         "condition": {"type": "CUSTOM_FORMULA", "values": [{"userEnteredValue": '=$B3="READY NOW"'}]},
                         "format": {
-                            "backgroundColor": {"red": 0.831, "green": 0.929, "blue": 0.855},
-                            "textFormat": {"foregroundColor": {"red": 0.082, "green": 0.341, "blue": 0.141}, "bold": True},
+                            "backgroundColor": _CF_GREEN_BG,
+                            "textFormat": {"foregroundColor": _CF_GREEN_FG, "bold": True},
                         },
                     },
                 },
@@ -490,8 +662,8 @@ def _ensure_sheet_structure(service, sheet_id: str) -> None:
                     "booleanRule": {
                         "condition": {"type": "CUSTOM_FORMULA", "values": [{"userEnteredValue": '=$B3="HEADS UP"'}]},
                         "format": {
-                            "backgroundColor": {"red": 1.0, "green": 0.953, "blue": 0.804},
-                            "textFormat": {"foregroundColor": {"red": 0.522, "green": 0.392, "blue": 0.016}, "bold": True},
+                            "backgroundColor": _CF_AMBER_BG,
+                            "textFormat": {"foregroundColor": _CF_AMBER_FG, "bold": True},
                         },
                     },
                 },
@@ -506,8 +678,8 @@ def _ensure_sheet_structure(service, sheet_id: str) -> None:
                     "booleanRule": {
                         "condition": {"type": "CUSTOM_FORMULA", "values": [{"userEnteredValue": '=$B3="DONE"'}]},
                         "format": {
-                            "backgroundColor": {"red": 0.886, "green": 0.890, "blue": 0.898},
-                            "textFormat": {"foregroundColor": {"red": 0.424, "green": 0.459, "blue": 0.490}, "strikethrough": True},
+                            "backgroundColor": _CF_DONE_BG,
+                            "textFormat": {"foregroundColor": _MUTED_GRAY, "strikethrough": True},
                         },
                     },
                 },
@@ -522,7 +694,7 @@ def _ensure_sheet_structure(service, sheet_id: str) -> None:
                     "booleanRule": {
                         "condition": {"type": "CUSTOM_FORMULA", "values": [{"userEnteredValue": '=$B3="Upcoming"'}]},
                         "format": {
-                            "backgroundColor": {"red": 1.0, "green": 1.0, "blue": 1.0},
+                            "backgroundColor": _WHITE,
                         },
                     },
                 },
@@ -534,57 +706,62 @@ def _ensure_sheet_structure(service, sheet_id: str) -> None:
         {
             "repeatCell": {
                 "range": {"sheetId": sid, "startRowIndex": 2, "endRowIndex": 100, "startColumnIndex": 1, "endColumnIndex": 2},
-                "cell": {"userEnteredFormat": {"textFormat": {"foregroundColor": {"red": 0.424, "green": 0.459, "blue": 0.490}}}},
+                "cell": {"userEnteredFormat": {"textFormat": {"foregroundColor": _MUTED_GRAY}}},
                 "fields": "userEnteredFormat.textFormat.foregroundColor",
             }
         },
 
         # === 6. Cell alignment ===
-        # Centered columns: A(0), B(1), D(3), J(9)
+        # Default LEFT across all columns, then overlay CENTER on the
+        # contiguous centered spans: A-B (0-1), D (3), J (9). One request
+        # per span instead of one per column.
+        {
+            "repeatCell": {
+                "range": {"sheetId": sid, "startRowIndex": 2, "endRowIndex": 100, "startColumnIndex": 0, "endColumnIndex": NUM_COLS},
+                "cell": {"userEnteredFormat": {"horizontalAlignment": "LEFT", "verticalAlignment": "TOP"}},
+                "fields": "userEnteredFormat(horizontalAlignment,verticalAlignment)",
+            }
+        },
         *[
             {
                 "repeatCell": {
-                    "range": {"sheetId": sid, "startRowIndex": 2, "endRowIndex": 100, "startColumnIndex": c, "endColumnIndex": c + 1},
+                    "range": {"sheetId": sid, "startRowIndex": 2, "endRowIndex": 100, "startColumnIndex": start, "endColumnIndex": end},
                     "cell": {"userEnteredFormat": {"horizontalAlignment": "CENTER", "verticalAlignment": "TOP"}},
                     "fields": "userEnteredFormat(horizontalAlignment,verticalAlignment)",
                 }
             }
-            for c in [0, 1, 3, 9]
+            for start, end in [(0, 2), (3, 4), (9, 10)]
         ],
-        # Left-aligned columns: C(2), E(4), F(5), G(6), H(7), I(8), K(10)
-        *[
-            {
-                "repeatCell": {
-                    "range": {"sheetId": sid, "startRowIndex": 2, "endRowIndex": 100, "startColumnIndex": c, "endColumnIndex": c + 1},
-                    "cell": {"userEnteredFormat": {"horizontalAlignment": "LEFT", "verticalAlignment": "TOP"}},
-                    "fields": "userEnteredFormat(horizontalAlignment,verticalAlignment)",
-                }
+
+        # === 7. Text wrapping for F through I (contiguous cols 5-8) ===
+        {
+            "repeatCell": {
+                "range": {"sheetId": sid, "startColumnIndex": 5, "endColumnIndex": 9},
+                "cell": {"userEnteredFormat": {"wrapStrategy": "WRAP"}},
+                "fields": "userEnteredFormat.wrapStrategy",
             }
-            for c in [2, 4, 5, 6, 7, 8, 10]
-        ],
+        },
 
-        # === 7. Text wrapping for F, G, H, I ===
-        *[
-            {
-                "repeatCell": {
-                    "range": {"sheetId": sid, "startColumnIndex": c, "endColumnIndex": c + 1},
-                    "cell": {"userEnteredFormat": {"wrapStrategy": "WRAP"}},
-                    "fields": "userEnteredFormat.wrapStrategy",
-                }
+        # === 7b. Products column padding (previously applied per-row with
+        # the rich-text write; now part of the static structure) ===
+        {
+            "repeatCell": {
+                "range": {"sheetId": sid, "startRowIndex": 2, "endRowIndex": 100, "startColumnIndex": 6, "endColumnIndex": 7},
+                "cell": {"userEnteredFormat": {"padding": {"top": 4, "bottom": 4, "left": 6, "right": 6}}},
+                "fields": "userEnteredFormat.padding",
             }
-            for c in [5, 6, 7, 8]
-        ],
+        },
 
         # === 8. Borders — data rows ===
         {
             "updateBorders": {
                 "range": row3_plus,
-                "top": {"style": "SOLID", "color": {"red": 0.871, "green": 0.886, "blue": 0.898}},
-                "bottom": {"style": "SOLID", "color": {"red": 0.871, "green": 0.886, "blue": 0.898}},
-                "left": {"style": "SOLID", "color": {"red": 0.871, "green": 0.886, "blue": 0.898}},
-                "right": {"style": "SOLID", "color": {"red": 0.871, "green": 0.886, "blue": 0.898}},
-                "innerHorizontal": {"style": "SOLID", "color": {"red": 0.871, "green": 0.886, "blue": 0.898}},
-                "innerVertical": {"style": "SOLID", "color": {"red": 0.871, "green": 0.886, "blue": 0.898}},
+                "top": {"style": "SOLID", "color": _BORDER_GRAY},
+                "bottom": {"style": "SOLID", "color": _BORDER_GRAY},
+                "left": {"style": "SOLID", "color": _BORDER_GRAY},
+                "right": {"style": "SOLID", "color": _BORDER_GRAY},
+                "innerHorizontal": {"style": "SOLID", "color": _BORDER_GRAY},
+                "innerVertical": {"style": "SOLID", "color": _BORDER_GRAY},
             }
         },
 
@@ -621,85 +798,30 @@ def _ensure_sheet_structure(service, sheet_id: str) -> None:
         },
     ]
 
-    service.spreadsheets().batchUpdate(
-        spreadsheetId=sheet_id,
-        body={"requests": requests_batch},
-    ).execute()
-
-
-def _apply_product_rich_text(service, sheet_id: str, product_runs_by_row: list, rows: list) -> None:
-    """Apply bold product names to column G cells using textFormatRuns."""
-    spreadsheet = service.spreadsheets().get(
-        spreadsheetId=sheet_id,
-        fields="sheets.properties",
-    ).execute()
-    sid = spreadsheet["sheets"][0]["properties"]["sheetId"]
-
-    update_requests = []
-    for i, (runs, row) in enumerate(zip(product_runs_by_row, rows)):
-        if not runs:
-            continue
-        product_text = row[6]  # Column G
-        if not product_text:
-            continue
-        # Row index = i + 2 (row 3 is index 2, 0-based)
-        update_requests.append({
-            "updateCells": {
-                "rows": [{
-                    "values": [{
-                        "userEnteredValue": {"stringValue": product_text},
-                        "textFormatRuns": runs,
-                        "userEnteredFormat": {
-                            "wrapStrategy": "WRAP",
-                            "verticalAlignment": "TOP",
-                            "padding": {"top": 4, "bottom": 4, "left": 6, "right": 6},
-                        },
-                    }]
-                }],
-                "range": {
-                    "sheetId": sid,
-                    "startRowIndex": i + 2,
-                    "endRowIndex": i + 3,
-                    "startColumnIndex": 6,  # Column G
-                    "endColumnIndex": 7,
-                },
-                "fields": "userEnteredValue,textFormatRuns,userEnteredFormat(wrapStrategy,verticalAlignment,padding)",
+    # Record the structure version so the next run can skip all of this
+    if meta_id is None:
+        requests_batch.append({
+            "createDeveloperMetadata": {
+                "developerMetadata": {
+                    "metadataKey": _STRUCTURE_METADATA_KEY,
+                    "metadataValue": _STRUCTURE_VERSION,
+                    "location": {"sheetId": sid},
+                    "visibility": "DOCUMENT",
+                }
+            }
+        })
+    else:
+        requests_batch.append({
+            "updateDeveloperMetadata": {
+                "dataFilters": [{"developerMetadataLookup": {"metadataId": meta_id}}],
+                "developerMetadata": {"metadataValue": _STRUCTURE_VERSION},
+                "fields": "metadataValue",
             }
         })
 
-    if update_requests:
-        service.spreadsheets().batchUpdate(
-            spreadsheetId=sheet_id,
-            body={"requests": update_requests},
-        ).execute()
-
-
-def _apply_checkboxes(service, sheet_id: str, num_app_rows: int) -> None:
-    """Apply checkbox data validation to column A for app rows."""
-    spreadsheet = service.spreadsheets().get(
+    _execute_with_retry(service.spreadsheets().batchUpdate(
         spreadsheetId=sheet_id,
-        fields="sheets.properties",
-    ).execute()
-    sid = spreadsheet["sheets"][0]["properties"]["sheetId"]
-
-    # Checkbox validation for column A, rows 3 through 3+num_app_rows
-    request = {
-        "setDataValidation": {
-            "range": {
-                "sheetId": sid,
-                "startRowIndex": 2,  # row 3 (0-indexed)
-                "endRowIndex": 2 + num_app_rows,
-                "startColumnIndex": 0,
-                "endColumnIndex": 1,
-            },
-            "rule": {
-                "condition": {"type": "BOOLEAN"},
-                "showCustomUi": True,
-            },
-        }
-    }
+        body={"requests": requests_batch},
+    ))
 
-    service.spreadsheets().batchUpdate(
-        spreadsheetId=sheet_id,
-        body={"requests": [request]},
-    ).execute()
+    return sid
@@ -1,49 +1,70 @@
 """Decision engine for evaluating application triggers."""
 
-from datetime import date, datetime, timedelta
+import collections
+import functools
+from datetime import date, timedelta
 from typing import Any
 
 # Projection data is injected via evaluate_trigger's projections param
 # Format: list of {"date": "YYYY-MM-DD", "projected_soil_temp": float}
 
+# Sort sentinel for apps with no projected date or window
+_FAR_FUTURE = date(9999, 12, 31)
+
+
+@functools.lru_cache(maxsize=256)
+def _parse_date_cached(date_str: str, year: int) -> date:
+    """Parse with the year resolved, so results cache cleanly by (str, year)."""
+    if len(date_str) == 5:  # MM-DD format - slice directly, no strptime
+        return date(year, int(date_str[:2]), int(date_str[3:]))
+    return date.fromisoformat(date_str)
+
 
 def parse_date(date_str: str, year: int | None = None) -> date:
-    """Parse a date string, handling MM-DD format by adding current year."""
+    """Parse a date string, handling MM-DD format by adding current year.
+
+    The schedule's window strings get re-parsed on every trigger pass, so
+    parses are memoized; the year default is resolved before the cache so
+    entries stay correct across a year boundary.
+    """
     if year is None:
         year = date.today().year
-
-    if len(date_str) == 5:  # MM-DD format
-        return datetime.strptime(f"{year}-{date_str}", "%Y-%m-%d").date()
-    return datetime.strptime(date_str, "%Y-%m-%d").date()
+    return _parse_date_cached(date_str, year)
 
 
 def count_consecutive_days_at_temp(
-    history: list[dict],
+    temps: list[float],
     threshold: float,
     direction: str,
+    needed: int | None = None,
 ) -> int:
     """
     Count consecutive days where temp meets threshold condition.
 
     Args:
-        history: List of {"date": "YYYY-MM-DD", "temp": float} entries, newest first
+        temps: Temperatures in Fahrenheit, newest first (the
+               soil_temp_history_temps list from state)
         threshold: Temperature threshold in Fahrenheit
         direction: "rising" (temp >= threshold) or "falling" (temp <= threshold)
+        needed: Optional streak length that satisfies the caller; counting
+                stops as soon as it is reached
 
     Returns:
-        Number of consecutive days meeting the condition
+        Number of consecutive days meeting the condition (capped at needed)
     """
-    if not history:
+    if not temps:
         return 0
 
+    # Pick the comparator once instead of re-branching on the direction
+    # string for every entry
+    meets = (lambda t: t >= threshold) if direction == "rising" else (lambda t: t <= threshold)
+
     count = 0
-    for entry in history:
-        temp = entry["temp"]
-        if direction == "rising" and temp >= threshold:
-            count += 1
-        elif direction == "falling" and temp <= threshold:
-            count += 1
-        else:
+    for temp in temps:
+        if not meets(temp):
+            break
+        count += 1
+        if needed and count >= needed:
             break
 
     return count
@@ -56,13 +77,26 @@ def evaluate_trigger(
     today: date,
     all_apps: dict[str, dict],
     projections: list[dict] | None = None,
+    _cache: dict[str, dict] | None = None,
+    completed_dates: dict[str, date] | None = None,
 ) -> dict[str, Any]:
     """
     Evaluate if an application's trigger condition is met.
 
+    Thin wrapper that short-circuits completed apps; same_as recursion
+    comes through here so a completed reference still reads as such.
+    get_upcoming_applications filters completed apps itself and calls
+    _evaluate_trigger_impl directly.
+
     Args:
         projections: Optional list of {"date": "YYYY-MM-DD", "projected_soil_temp": float}
                      used to estimate when soil temp triggers will fire.
+        _cache: Optional per-pass memo of app_id -> result, so an app
+                referenced by several same_as triggers evaluates once.
+                Callers treat cached results as read-only.
+        completed_dates: Optional pre-parsed {app_id: date} view of
+                         state["completed"], built once per pass by
+                         get_upcoming_applications.
 
     Returns:
         {
@@ -73,10 +107,47 @@ def evaluate_trigger(
             "window_end": date | None,
         }
     """
+    completed = state.get("completed", {})
+    if app["id"] in completed:
+        if _cache is not None:
+            cached = _cache.get(app["id"])
+            if cached is not None:
+                return cached
+        result = {
+            "ready": False,
+            "heads_up": False,
+            "projected_date": None,
+            "reason": f"Completed on {completed[app['id']]}",
+            "window_start": None,
+            "window_end": None,
+        }
+        if _cache is not None:
+            _cache[app["id"]] = result
+        return result
+
+    return _evaluate_trigger_impl(app, state, soil_temp, today, all_apps, projections, _cache, completed_dates)
+
+
+def _evaluate_trigger_impl(
+    app: dict[str, Any],
+    state: dict[str, Any],
+    soil_temp: float | None,
+    today: date,
+    all_apps: dict[str, dict],
+    projections: list[dict] | None = None,
+    _cache: dict[str, dict] | None = None,
+    completed_dates: dict[str, date] | None = None,
+) -> dict[str, Any]:
+    """Evaluate a trigger for an app already known to be incomplete."""
+    if _cache is not None:
+        cached = _cache.get(app["id"])
+        if cached is not None:
+            return cached
+
     trigger = app.get("trigger", {})
     trigger_type = trigger.get("type")
     completed = state.get("completed", {})
-    history = state.get("soil_temp_history", [])
+    temps = state.get("soil_temp_history_temps", [])
 
     result = {
         "ready": False,
@@ -87,25 +158,22 @@ def evaluate_trigger(
         "window_end": None,
     }
 
-    # Already completed
-    if app["id"] in completed:
-        result["reason"] = f"Completed on {completed[app['id']]}"
-        return result
-
     if trigger_type == "soil_temp":
-        result = _evaluate_soil_temp_rising(app, trigger, history, soil_temp, today, result, projections)
+        result = _evaluate_soil_temp_rising(app, trigger, temps, soil_temp, today, result, projections)
 
     elif trigger_type == "soil_temp_falling":
-        result = _evaluate_soil_temp_falling(app, trigger, history, soil_temp, today, result, projections)
+        result = _evaluate_soil_temp_falling(app, trigger, temps, soil_temp, today, result, projections)
 
     elif trigger_type == "days_after":
-        result = _evaluate_days_after(trigger, completed, today, result)
+        if completed_dates is None:
+            completed_dates = {k: date.fromisoformat(v) for k, v in completed.items()}
+        result = _evaluate_days_after(trigger, completed_dates, today, result)
 
     elif trigger_type == "calendar_window":
         result = _evaluate_calendar_window(trigger, today, result)
 
     elif trigger_type == "same_as":
-        result = _evaluate_same_as(trigger, all_apps, state, soil_temp, today, result, projections)
+        result = _evaluate_same_as(trigger, all_apps, state, soil_temp, today, result, projections, _cache, completed_dates)
 
     else:
         result["reason"] = f"Unknown trigger type: {trigger_type}"
@@ -118,6 +186,8 @@ def evaluate_trigger(
             if 0 < days_until <= alert_days:
                 result["heads_up"] = True
 
+    if _cache is not None:
+        _cache[app["id"]] = result
     return result
 
 
@@ -141,7 +211,7 @@ def _estimate_threshold_date(
            (direction == "falling" and temp <= threshold):
             run += 1
             if run >= consecutive_needed:
-                return datetime.strptime(p["date"], "%Y-%m-%d").date()
+                return date.fromisoformat(p["date"])
         else:
             run = 0
 
@@ -151,7 +221,7 @@ def _estimate_threshold_date(
 def _evaluate_soil_temp_rising(
     app: dict,
     trigger: dict,
-    history: list,
+    temps: list[float],
     soil_temp: float | None,
     today: date,
     result: dict,
@@ -171,7 +241,7 @@ def _evaluate_soil_temp_rising(
         result["reason"] = "Waiting for soil temp data"
         return result
 
-    consecutive = count_consecutive_days_at_temp(history, threshold, direction)
+    consecutive = count_consecutive_days_at_temp(temps, threshold, direction, consecutive_needed)
 
     if consecutive >= consecutive_needed:
         result["ready"] = True
@@ -195,7 +265,7 @@ def _evaluate_soil_temp_rising(
 def _evaluate_soil_temp_falling(
     app: dict,
     trigger: dict,
-    history: list,
+    temps: list[float],
     soil_temp: float | None,
     today: date,
     result: dict,
@@ -217,7 +287,7 @@ def _evaluate_soil_temp_falling(
         result["reason"] = "Waiting for soil temp data"
         return result
 
-    consecutive = count_consecutive_days_at_temp(history, threshold, "falling")
+    consecutive = count_consecutive_days_at_temp(temps, threshold, "falling", consecutive_needed)
 
     if consecutive >= consecutive_needed:
         result["ready"] = True
@@ -244,7 +314,7 @@ def _evaluate_soil_temp_falling(
 
 def _evaluate_days_after(
     trigger: dict,
-    completed: dict,
+    completed_dates: dict[str, date],
     today: date,
     result: dict,
 ) -> dict:
@@ -253,11 +323,11 @@ def _evaluate_days_after(
     days_min = trigger["days_min"]
     days_max = trigger["days_max"]
 
-    if ref_id not in completed:
+    ref_date = completed_dates.get(ref_id)
+    if ref_date is None:
         result["reason"] = f"Waiting on {ref_id} to complete"
         return result
 
-    ref_date = datetime.strptime(completed[ref_id], "%Y-%m-%d").date()
     window_start = ref_date + timedelta(days=days_min)
     window_end = ref_date + timedelta(days=days_max)
 
@@ -312,6 +382,8 @@ def _evaluate_same_as(
     today: date,
     result: dict,
     projections: list[dict] | None = None,
+    _cache: dict[str, dict] | None = None,
+    completed_dates: dict[str, date] | None = None,
 ) -> dict:
     """Evaluate same_as trigger."""
     ref_id = trigger["reference_id"]
@@ -320,8 +392,9 @@ def _evaluate_same_as(
         result["reason"] = f"Reference app {ref_id} not found"
         return result
 
-    # Recursively evaluate the reference app
-    ref_result = evaluate_trigger(all_apps[ref_id], state, soil_temp, today, all_apps, projections)
+    # Recursively evaluate the reference app (memoized when several
+    # triggers chain to the same reference)
+    ref_result = evaluate_trigger(all_apps[ref_id], state, soil_temp, today, all_apps, projections, _cache, completed_dates)
     result["ready"] = ref_result["ready"]
     result["heads_up"] = ref_result.get("heads_up", False)
     result["projected_date"] = ref_result["projected_date"]
@@ -351,8 +424,18 @@ def get_upcoming_applications(
     applications = schedule.get("applications", [])
     completed = state.get("completed", {})
 
-    # Build lookup dict for same_as references
-    all_apps = {app["id"]: app for app in applications}
+    # Lookup dict for same_as references, cached on the schedule dict so
+    # repeated passes over the same loaded schedule skip the rebuild
+    all_apps = schedule.get("_apps_by_id")
+    if all_apps is None:
+        all_apps = {app["id"]: app for app in applications}
+        schedule["_apps_by_id"] = all_apps
+
+    # Per-pass memo: apps referenced by same_as triggers evaluate once
+    eval_cache: dict[str, dict] = {}
+
+    # Parse completion dates once; days_after triggers reuse the map
+    completed_dates = {k: date.fromisoformat(v) for k, v in completed.items()}
 
     upcoming = []
 
@@ -363,10 +446,12 @@ def get_upcoming_applications(
         if app_id in completed:
             continue
 
-        # Evaluate trigger
-        trigger_result = evaluate_trigger(app, state, soil_temp, today, all_apps, projections)
+        # Evaluate trigger (impl directly: the completed filter just ran)
+        trigger_result = _evaluate_trigger_impl(app, state, soil_temp, today, all_apps, projections, eval_cache, completed_dates)
 
-        # Build result entry
+        # Build result entry; trigger fields are assigned explicitly
+        # rather than dict-spread, which also documents what evaluate
+        # results carry
         entry = {
             "id": app_id,
             "name": app["name"],
@@ -378,23 +463,27 @@ def get_upcoming_applications(
             "warnings": app.get("warnings", []),
             "optional": app.get("optional", False),
             "schedule_order": idx,
-            **trigger_result,
+            "ready": trigger_result["ready"],
+            "heads_up": trigger_result["heads_up"],
+            "projected_date": trigger_result["projected_date"],
+            "reason": trigger_result["reason"],
+            "window_start": trigger_result["window_start"],
+            "window_end": trigger_result["window_end"],
         }
 
-        upcoming.append(entry)
+        # Precompute the sort key: ready first, then heads_up, then coming
+        # up; by projected date (window start as fallback); schedule order
+        # breaks ties.
+        tier = 0 if entry["ready"] else (1 if entry["heads_up"] else 2)
+        entry["_sort_key"] = (
+            tier,
+            entry["projected_date"] or entry["window_start"] or _FAR_FUTURE,
+            idx,
+        )
 
-    # Sort by: ready first, then heads_up, then coming up; by projected date; by schedule order
-    def sort_key(x):
-        if x["ready"]:
-            tier = 0
-        elif x.get("heads_up"):
-            tier = 1
-        else:
-            tier = 2
-        proj_date = x["projected_date"] or x["window_start"] or date(9999, 12, 31)
-        return (tier, proj_date, x["schedule_order"])
+        upcoming.append(entry)
 
-    upcoming.sort(key=sort_key)
+    upcoming.sort(key=lambda x: x["_sort_key"])
 
     return upcoming[:limit] if limit else upcoming
 
@@ -404,20 +493,30 @@ def update_soil_temp_history(
     soil_temp: float | None,
     today: date,
 ) -> None:
-    """Update soil temperature history in state."""
+    """Update soil temperature history in state.
+
+    History is stored as parallel dates/temps lists (newest first) so the
+    trigger engine's streak counting walks a flat float list instead of
+    dereferencing a dict per entry.
+    """
     if soil_temp is None:
         return
 
-    history = state.get("soil_temp_history", [])
-    today_str = today.strftime("%Y-%m-%d")
+    # Bounded deques: prepending today's reading and dropping the oldest
+    # entry are both O(1), with the 14-day cap enforced by maxlen. Stored
+    # back as plain lists so state serializes unchanged.
+    dates = collections.deque(state.get("soil_temp_history_dates", []), maxlen=14)
+    temps = collections.deque(state.get("soil_temp_history_temps", []), maxlen=14)
+    today_str = today.isoformat()
 
     # Check if we already have an entry for today
-    if history and history[0].get("date") == today_str:
-        history[0]["temp"] = soil_temp
+    if dates and dates[0] == today_str:
+        temps[0] = soil_temp
     else:
-        history.insert(0, {"date": today_str, "temp": soil_temp})
+        dates.appendleft(today_str)
+        temps.appendleft(soil_temp)
 
-    # Keep only last 14 days of history
-    state["soil_temp_history"] = history[:14]
+    state["soil_temp_history_dates"] = list(dates)
+    state["soil_temp_history_temps"] = list(temps)
     state["last_soil_temp_f"] = soil_temp
     state["last_check"] = today_str
@@ -6,24 +6,27 @@ Orchestrates soil temp fetching, trigger evaluation, Google Sheets dashboard,
 and Gmail notifications.
 """
 
-import json
 import logging
+from concurrent.futures import ThreadPoolExecutor
 from datetime import date
 
+from lawn_care import _json
 from lawn_care import (
+    append_completion,
     load_config,
     load_schedule,
     load_state,
     save_state,
-    fetch_soil_temp,
-    fetch_air_temp_forecast,
+    fetch_all,
     project_soil_temps,
     get_upcoming_applications,
     update_soil_temp_history,
+    partition_apps,
+    PartitionedApps,
     format_notification,
     read_done_checkboxes,
     update_dashboard,
-    send_ready_email,
+    send_ready_emails,
     send_heads_up_email,
 )
 
@@ -35,59 +38,76 @@ logging.basicConfig(
 logger = logging.getLogger(__name__)
 
 
-def process_done_checkboxes(config: dict, state: dict, schedule: dict, today: date) -> None:
-    """Read Google Sheet checkboxes and mark completed apps in state."""
+def _read_done_checkboxes_safe(config: dict) -> list[str]:
+    """read_done_checkboxes, with failures degraded to an empty list.
+
+    Runs on a worker thread alongside the weather fetches, so errors are
+    caught here rather than surfacing from a Future.
+    """
     try:
-        done_ids = read_done_checkboxes(config)
+        return read_done_checkboxes(config)
     except Exception as e:
         logger.warning(f"Failed to read Sheet checkboxes: {e}")
-        return
+        return []
 
+
+def process_done_checkboxes(done_ids: list[str], state: dict, schedule: dict, today: date) -> None:
+    """Mark apps completed in state from checked Sheet checkboxes."""
     if not done_ids:
         return
 
-    valid_app_ids = {app["id"] for app in schedule.get("applications", [])}
+    # Cached on the schedule dict (like the triggers module's app lookup)
+    # so repeated passes don't rebuild the set
+    valid_app_ids = schedule.get("_app_id_set")
+    if valid_app_ids is None:
+        valid_app_ids = {app["id"] for app in schedule.get("applications", [])}
+        schedule["_app_id_set"] = valid_app_ids
     completed = state.setdefault("completed", {})
     sent_alerts = state.get("sent_alerts", {})
-    today_str = today.strftime("%Y-%m-%d")
+    today_str = today.isoformat()
 
-    for app_id in done_ids:
-        if app_id not in valid_app_ids:
-            logger.warning(f"Unknown app_id from Sheet checkbox: {app_id}")
-            continue
-        if app_id in completed:
-            continue
+    # Set algebra instead of a branchy per-id loop: split the ids into
+    # unknown / newly-done once, then apply each bucket in bulk
+    done = set(done_ids)
+    for app_id in done - valid_app_ids:
+        logger.warning(f"Unknown app_id from Sheet checkbox: {app_id}")
 
+    new_done = (done & valid_app_ids) - completed.keys()
+    for app_id in new_done:
         completed[app_id] = today_str
-        if app_id in sent_alerts:
-            del sent_alerts[app_id]
+        # Durable O(1) record; the terminal save_state compacts the log
+        append_completion(app_id, today_str)
         logger.info(f"Marked done via Sheet: {app_id}")
-
-    save_state(state)
+    for app_id in new_done & sent_alerts.keys():
+        del sent_alerts[app_id]
 
 
 def send_email_notifications(
-    upcoming: list[dict],
+    parts: PartitionedApps,
     config: dict,
     state: dict,
     soil_temp: float | None,
     projections: list[dict] | None,
     today: date,
 ) -> None:
-    """Send Gmail notifications for ready and heads-up apps."""
+    """Send Gmail notifications for ready and heads-up apps.
+
+    Takes the PartitionedApps main() already built for the console
+    summary, so the upcoming list is classified once per run.
+    """
     area_sqft = config.get("area_sqft")
-    today_str = today.strftime("%Y-%m-%d")
+    today_str = today.isoformat()
     sent_alerts = state.setdefault("sent_alerts", {})
 
-    ready_apps = [a for a in upcoming if a["ready"]]
-    heads_up_apps = [a for a in upcoming if a.get("heads_up")]
+    ready_apps = parts.ready
+    heads_up_apps = parts.heads_up
 
-    # Send one email per ready app
-    for app in ready_apps:
-        if app["id"] not in sent_alerts:
-            if send_ready_email(app, soil_temp, area_sqft, config):
+    # One batch request covers every new ready app
+    new_ready = [a for a in ready_apps if a["id"] not in sent_alerts]
+    if new_ready:
+        if send_ready_emails(new_ready, soil_temp, area_sqft, config):
+            for app in new_ready:
                 sent_alerts[app["id"]] = today_str
-                save_state(state)
 
     # Send a single heads-up email for all new heads-up apps
     new_heads_up = [a for a in heads_up_apps if a["id"] not in sent_alerts]
@@ -95,7 +115,6 @@ def send_email_notifications(
         if send_heads_up_email(new_heads_up, soil_temp, projections, area_sqft, config):
             for app in new_heads_up:
                 sent_alerts[app["id"]] = today_str
-            save_state(state)
 
 
 def main():
@@ -111,31 +130,51 @@ def main():
     except FileNotFoundError as e:
         logger.error(f"Missing required file: {e}")
         return 1
-    except json.JSONDecodeError as e:
+    except _json.JSONDecodeError as e:
         logger.error(f"Invalid JSON: {e}")
         return 1
 
-    # Read Sheet checkboxes before evaluating triggers
-    process_done_checkboxes(config, state, schedule, today)
+    # Everything below mutates only the in-memory state dict; the single
+    # atomic write in the finally block persists completions, history,
+    # sent alerts, and the dashboard snapshot together, even if a later
+    # step raised.
+    try:
+        return _run(config, schedule, state, today)
+    finally:
+        save_state(state)
+
+
+def _run(config: dict, schedule: dict, state: dict, today: date) -> int:
+    """Body of the daily check; state is saved once by main()."""
+    # A fully completed season can't trigger anything, so decide that
+    # from local data before paying for the weather and Sheets calls.
+    applications = schedule.get("applications", [])
+    completed = state.get("completed", {})
+    if applications and all(app["id"] in completed for app in applications):
+        logger.info("All applications completed; nothing to evaluate")
+        return 0
 
-    # Fetch soil temperature
-    soil_temp = fetch_soil_temp(config)
+    # The weather fetches and the Sheet checkbox read are independent
+    # network calls; overlap them so the wall clock pays for the slowest
+    # one instead of the sum. fetch_all fans out internally as well.
+    with ThreadPoolExecutor(max_workers=2) as ex:
+        fetches = ex.submit(fetch_all, config)
+        done_ids = ex.submit(_read_done_checkboxes_safe, config)
+        soil_temp, _, air_forecast = fetches.result()
+        process_done_checkboxes(done_ids.result(), state, schedule, today)
 
     # Update state with new reading
     update_soil_temp_history(state, soil_temp, today)
-    save_state(state)
 
     # Build soil temp projections from weather forecast
     projections = None
-    if soil_temp is not None:
-        air_forecast = fetch_air_temp_forecast(config)
-        if air_forecast:
-            projections = project_soil_temps(soil_temp, air_forecast)
-            if projections:
-                logger.info(
-                    f"Projected soil temps: today {soil_temp}F -> "
-                    f"{projections[-1]['date']} {projections[-1]['projected_soil_temp']}F"
-                )
+    if soil_temp is not None and air_forecast:
+        projections = project_soil_temps(soil_temp, air_forecast)
+        if projections:
+            logger.info(
+                f"Projected soil temps: today {soil_temp}F -> "
+                f"{projections[-1]['date']} {projections[-1]['projected_soil_temp']}F"
+            )
 
     # Get ALL upcoming apps for dashboard (limit=0)
     all_upcoming = get_upcoming_applications(schedule, state, soil_temp, today, limit=0, projections=projections)
@@ -153,18 +192,19 @@ def main():
     # Get top 5 for notification evaluation and console display
     notify_upcoming = all_upcoming[:5]
 
-    ready_apps = [a for a in notify_upcoming if a["ready"]]
-    heads_up_apps = [a for a in notify_upcoming if a.get("heads_up")]
+    parts = partition_apps(notify_upcoming)
+    ready_apps = parts.ready
+    heads_up_apps = parts.heads_up
 
     # Format and display full summary to console
     area_sqft = config.get("area_sqft")
-    message = format_notification(notify_upcoming, soil_temp, projections, area_sqft)
+    message = format_notification(parts, soil_temp, projections, area_sqft)
     print("\n" + message + "\n")
 
     # Send email notifications if anything is actionable
     if ready_apps or heads_up_apps:
         logger.info(f"{len(ready_apps)} ready, {len(heads_up_apps)} heads-up")
-        send_email_notifications(notify_upcoming, config, state, soil_temp, projections, today)
+        send_email_notifications(parts, config, state, soil_temp, projections, today)
     else:
         logger.info("No applications ready or approaching")
 